@@ -13,11 +13,38 @@ Integration:
     3. Session creation: validate model_id against this registry
 """
 
-from typing import Any, Dict, List, Optional
+import hashlib
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import orjson
 
 
 # ─── Model Definition ────────────────────────────────────────────
 
+PRICE_UNITS_PER_USD = 100_000_000
+
+@dataclass(slots=True, frozen=True)
+class ModelEntry:
+    """A single catalog entry. Immutable, so it is safe to share between callers."""
+    model_id: str
+    name: str
+    context_window: int
+    context_k: int
+    price_per_1m_input: float
+    price_per_1m_output: float
+    tier: str  # "flagship" | "standard" | "fast" | "mini" | "local"
+    notes: str
+    # Prices in 1e-8 USD per 1M tokens, for exact integer cost arithmetic
+    _price_in_units: int = 0
+    _price_out_units: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain-dict form (public fields only), for JSON responses and merged views."""
+        return {name: getattr(self, name) for name in self.__slots__ if name[0] != "_"}
+
+
 def _m(
     model_id: str,
     name: str,
@@ -26,18 +53,23 @@ def _m(
     output_price: float,
     tier: str = "standard",
     notes: str = "",
-) -> Dict[str, Any]:
+) -> ModelEntry:
     """Helper to create a model entry."""
-    return {
-        "model_id": model_id,
-        "name": name,
-        "context_window": context_k * 1024,
-        "context_k": context_k,
-        "price_per_1m_input": input_price,
-        "price_per_1m_output": output_price,
-        "tier": tier,  # "flagship" | "standard" | "fast" | "mini" | "local"
-        "notes": notes,
-    }
+    # model_id and tier are used as lookup keys and compared often; interning
+    # makes those comparisons identity checks. Provider keys are identifier-like
+    # literals, which the compiler already interns.
+    return ModelEntry(
+        model_id=sys.intern(model_id),
+        name=name,
+        context_window=context_k * 1024,
+        context_k=context_k,
+        price_per_1m_input=input_price,
+        price_per_1m_output=output_price,
+        tier=sys.intern(tier),
+        notes=notes,
+        _price_in_units=round(input_price * PRICE_UNITS_PER_USD),
+        _price_out_units=round(output_price * PRICE_UNITS_PER_USD),
+    )
 
 
 # ─── Provider Definitions ────────────────────────────────────────
@@ -54,7 +86,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
         "api_base": "https://api.anthropic.com/v1",
         "env_key": "ANTHROPIC_API_KEY",
         "api_format": "anthropic",  # native Anthropic format
-        "models": [
+        "models": (
             _m("claude-opus-4-6", "Claude Opus 4.6",
                200, 5.00, 25.00, "flagship",
                "Most intelligent. Best for deep analysis"),
@@ -67,7 +99,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
             _m("claude-haiku-4-5-20251001", "Claude Haiku 4.5",
                200, 0.80, 4.00, "fast",
                "Fast and cheap. Good for quick checks"),
-        ],
+        ),
     },
 
     # ═══════════════════════════════════════════════════════════════
@@ -80,7 +112,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
         "api_base": "https://api.openai.com/v1",
         "env_key": "OPENAI_API_KEY",
         "api_format": "openai",
-        "models": [
+        "models": (
             _m("gpt-5.2", "GPT-5.2",
                128, 1.75, 14.00, "flagship",
                "Latest flagship. Best reasoning + coding. Feb 2026"),
@@ -105,7 +137,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
             _m("gpt-4o", "GPT-4o",
                128, 2.50, 10.00, "standard",
                "Legacy flagship. Multimodal. Mature & stable"),
-        ],
+        ),
     },
 
     # ═══════════════════════════════════════════════════════════════
@@ -118,7 +150,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
         "api_base": "https://generativelanguage.googleapis.com/v1beta",
         "env_key": "GOOGLE_API_KEY",
         "api_format": "google",
-        "models": [
+        "models": (
             _m("gemini-3-pro-preview", "Gemini 3 Pro (Preview)",
                1000, 2.00, 12.00, "flagship",
                "Latest frontier. 1M context. Preview pricing"),
@@ -137,7 +169,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
             _m("gemini-2.0-flash", "Gemini 2.0 Flash",
                1000, 0.10, 0.40, "fast",
                "Legacy fast model. Stable. Deprecates Mar 2026"),
-        ],
+        ),
     },
 
     # ═══════════════════════════════════════════════════════════════
@@ -150,7 +182,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
         "api_base": "https://api.x.ai/v1",
         "env_key": "XAI_API_KEY",
         "api_format": "openai",
-        "models": [
+        "models": (
             _m("grok-4", "Grok 4",
                256, 3.00, 15.00, "flagship",
                "Most capable. Deep reasoning. 256K context"),
@@ -166,7 +198,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
             _m("grok-code-fast-1", "Grok Code Fast",
                2000, 0.20, 0.50, "fast",
                "Optimized for code analysis"),
-        ],
+        ),
     },
 
     # ═══════════════════════════════════════════════════════════════
@@ -179,7 +211,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
         "api_base": "https://api.deepseek.com",
         "env_key": "DEEPSEEK_API_KEY",
         "api_format": "openai",
-        "models": [
+        "models": (
             _m("deepseek-reasoner", "DeepSeek R1 (V3.2 Reasoner)",
                128, 0.55, 2.19, "flagship",
                "Best reasoning. o1-class at 95% less cost"),
@@ -192,7 +224,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
             _m("deepseek-v3.1", "DeepSeek V3.1",
                128, 0.15, 0.75, "fast",
                "Previous general model. Good value"),
-        ],
+        ),
     },
 
     # ═══════════════════════════════════════════════════════════════
@@ -206,7 +238,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
         "api_base": "https://api.perplexity.ai",
         "env_key": "PERPLEXITY_API_KEY",
         "api_format": "openai",
-        "models": [
+        "models": (
             _m("sonar-deep-research", "Sonar Deep Research",
                128, 2.00, 8.00, "flagship",
                "Multi-step research. Reasoning + search"),
@@ -219,7 +251,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
             _m("sonar", "Sonar",
                128, 1.00, 1.00, "fast",
                "Fast search. Most affordable Perplexity model"),
-        ],
+        ),
     },
 
     # ═══════════════════════════════════════════════════════════════
@@ -232,7 +264,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
         "api_base": "https://api.mistral.ai/v1",
         "env_key": "MISTRAL_API_KEY",
         "api_format": "openai",
-        "models": [
+        "models": (
             _m("mistral-large-latest", "Mistral Large",
                128, 2.00, 6.00, "flagship",
                "Most capable Mistral model"),
@@ -245,7 +277,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
             _m("codestral-latest", "Codestral",
                256, 0.30, 0.90, "standard",
                "Optimized for code. 256K context"),
-        ],
+        ),
     },
 
     # ═══════════════════════════════════════════════════════════════
@@ -258,7 +290,7 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
         "api_base": "http://localhost:11434",
         "env_key": None,
         "api_format": "ollama",
-        "models": [
+        "models": (
             _m("llama3.3:70b", "Llama 3.3 70B",
                128, 0.0, 0.0, "flagship",
                "Largest local. Needs 48GB+ VRAM"),
@@ -283,82 +315,97 @@ PROVIDERS: Dict[str, Dict[str, Any]] = {
             _m("deepseek-r1:70b", "DeepSeek R1 70B (distilled)",
                128, 0.0, 0.0, "flagship",
                "Best local reasoning. 48GB+ VRAM"),
-        ],
+        ),
     },
 }
 
 
+# ─── Lookup Index ────────────────────────────────────────────────
+# PROVIDERS is static, so (provider_id, model_id) lookups are resolved once
+# here instead of scanning provider["models"] on every call.
+
+_MODEL_INDEX: Dict[Tuple[str, str], ModelEntry] = {
+    (pid, m.model_id): m
+    for pid, p in PROVIDERS.items()
+    for m in p["models"]
+}
+
 # ─── Helper Functions ────────────────────────────────────────────
 
+# Plain dicts with models as to_dict() output, so the result serializes with
+# json/orjson as-is (the GET /api/models use case)
+_ALL_PROVIDERS: Tuple[Dict[str, Any], ...] = tuple(
+    {
+        "provider_id": key,
+        "display_name": provider["display_name"],
+        "env_key": provider.get("env_key"),
+        "model_count": len(provider["models"]),
+        "models": [m.to_dict() for m in provider["models"]],
+    }
+    for key, provider in PROVIDERS.items()
+)
+
+
 def get_all_providers() -> List[Dict[str, Any]]:
-    """Return list of all providers with their models."""
-    result = []
-    for key, provider in PROVIDERS.items():
-        result.append({
-            "provider_id": key,
-            "display_name": provider["display_name"],
-            "env_key": provider.get("env_key"),
-            "model_count": len(provider["models"]),
-            "models": provider["models"],
-        })
-    return result
-
-
-def get_provider_models(provider_id: str) -> List[Dict[str, Any]]:
-    """Return models for a specific provider."""
+    """Return all providers with their models (entries are shared; treat as read-only)."""
+    return list(_ALL_PROVIDERS)
+
+
+def get_provider_models(provider_id: str) -> Tuple[ModelEntry, ...]:
+    """Return models for a specific provider (immutable; no copy is made)."""
     provider = PROVIDERS.get(provider_id)
     if not provider:
-        return []
+        return ()
     return provider["models"]
 
 
+_ALL_MODELS_FLAT: Tuple[Dict[str, Any], ...] = tuple(
+    {**m.to_dict(), "provider_id": key, "provider_name": provider["display_name"]}
+    for key, provider in PROVIDERS.items()
+    for m in provider["models"]
+)
+
+
 def get_all_models() -> List[Dict[str, Any]]:
-    """Flat list of all models across all providers."""
-    result = []
-    for key, provider in PROVIDERS.items():
-        for model in provider["models"]:
-            result.append({
-                **model,
-                "provider_id": key,
-                "provider_name": provider["display_name"],
-            })
-    return result
+    """Flat list of all models across all providers (entries are shared; treat as read-only)."""
+    return list(_ALL_MODELS_FLAT)
 
 
 def validate_model(provider_id: str, model_id: str) -> bool:
     """Check if a model_id is valid for a given provider."""
-    models = get_provider_models(provider_id)
-    return any(m["model_id"] == model_id for m in models)
+    return (provider_id, model_id) in _MODEL_INDEX
 
 
 def get_model_info(provider_id: str, model_id: str) -> Optional[Dict[str, Any]]:
     """Get full model info."""
-    models = get_provider_models(provider_id)
-    for m in models:
-        if m["model_id"] == model_id:
-            return {**m, "provider_id": provider_id}
-    return None
+    m = _MODEL_INDEX.get((provider_id, model_id))
+    return {**m.to_dict(), "provider_id": provider_id} if m else None
+
+
+def get_model_infos(pairs: Sequence[Tuple[str, str]]) -> List[Optional[Dict[str, Any]]]:
+    """Batch form of get_model_info for (provider_id, model_id) pairs, in order."""
+    idx = _MODEL_INDEX
+    return [
+        {**m.to_dict(), "provider_id": pid} if (m := idx.get((pid, mid))) else None
+        for pid, mid in pairs
+    ]
 
 
 def estimate_cost(provider_id: str, model_id: str, input_tokens: int, output_tokens: int) -> float:
     """Estimate cost in USD for a given token count."""
-    info = get_model_info(provider_id, model_id)
-    if not info:
+    m = _MODEL_INDEX.get((provider_id, model_id))
+    if not m:
         return 0.0
-    cost = (
-        (input_tokens / 1_000_000) * info["price_per_1m_input"]
-        + (output_tokens / 1_000_000) * info["price_per_1m_output"]
-    )
-    return round(cost, 4)
+    # Exact integer arithmetic, rounded half-up to 1e-4 USD (1e10 units)
+    # before the single division that converts to USD.
+    total_units = input_tokens * m._price_in_units + output_tokens * m._price_out_units
+    rounded_units = (total_units + 5_000_000_000) // 10_000_000_000 * 10_000_000_000
+    return rounded_units / (PRICE_UNITS_PER_USD * 1_000_000)
 
 
 # ─── API Endpoint Data ───────────────────────────────────────────
 
-def get_models_for_api() -> Dict[str, Any]:
-    """
-    Return data structured for the frontend API.
-    Use in: GET /api/models
-    """
+def _build_models_for_api() -> Dict[str, Any]:
     return {
         "providers": [
             {
@@ -368,13 +415,13 @@ def get_models_for_api() -> Dict[str, Any]:
                 "env_key": provider.get("env_key"),
                 "models": [
                     {
-                        "id": m["model_id"],
-                        "name": m["name"],
-                        "context": m["context_k"],
-                        "tier": m["tier"],
-                        "price_input": m["price_per_1m_input"],
-                        "price_output": m["price_per_1m_output"],
-                        "notes": m["notes"],
+                        "id": m.model_id,
+                        "name": m.name,
+                        "context": m.context_k,
+                        "tier": m.tier,
+                        "price_input": m.price_per_1m_input,
+                        "price_output": m.price_per_1m_output,
+                        "notes": m.notes,
                     }
                     for m in provider["models"]
                 ],
@@ -386,20 +433,40 @@ def get_models_for_api() -> Dict[str, Any]:
     }
 
 
+_MODELS_FOR_API = _build_models_for_api()
+
+
+def get_models_for_api() -> Dict[str, Any]:
+    """
+    Return data structured for the frontend API.
+    Use in: GET /api/models
+
+    The payload is built once at import and shared between callers;
+    treat it as read-only.
+    """
+    return _MODELS_FOR_API
+
+
+# Serialized once: the catalog never changes at runtime, so the JSON body and
+# its validator are computed at import rather than per request.
+MODELS_JSON: bytes = orjson.dumps(_MODELS_FOR_API)
+MODELS_ETAG: str = hashlib.sha256(MODELS_JSON).hexdigest()[:16]
+
+
 # ─── Quick Reference (for console) ──────────────────────────────
 
 if __name__ == "__main__":
-    print("ECR-VP Model Registry — February 2026")
-    print("=" * 60)
+    lines = ["ECR-VP Model Registry — February 2026", "=" * 60]
     total = 0
     for key, provider in PROVIDERS.items():
         n = len(provider["models"])
         total += n
-        print(f"\n{provider['display_name']} ({n} models):")
+        lines.append(f"\n{provider['display_name']} ({n} models):")
         for m in provider["models"]:
-            price = f"${m['price_per_1m_input']}/{m['price_per_1m_output']}"
-            if m["price_per_1m_input"] == 0:
+            price = f"${m.price_per_1m_input}/{m.price_per_1m_output}"
+            if m.price_per_1m_input == 0:
                 price = "FREE (local)"
-            ctx = f"{m['context_k']}K"
-            print(f"  [{m['tier']:8s}] {m['model_id']:35s} {ctx:>6s}  {price:>12s}")
-    print(f"\nTotal: {len(PROVIDERS)} providers, {total} models")
+            ctx = f"{m.context_k}K"
+            lines.append(f"  [{m.tier:8s}] {m.model_id:35s} {ctx:>6s}  {price:>12s}")
+    lines.append(f"\nTotal: {len(PROVIDERS)} providers, {total} models")
+    sys.stdout.write("\n".join(lines) + "\n")
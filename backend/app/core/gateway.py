@@ -8,7 +8,9 @@ The gateway ensures identical input and captures immutable output.
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import mmap
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from pathlib import Path
@@ -17,20 +19,56 @@ from typing import Optional
 from ..models.schema import InterpreterConfig, InterpreterResponse
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FilePayload:
-    """A file to be sent to an interpreter."""
+    """
+    A file to be sent to an interpreter.
+    content is any bytes-like object; use str(content, "utf-8") rather
+    than .decode() so memory-mapped payloads work too.
+    sha256 is the corpus hash when known, usable as a cache key for
+    derived forms (extracted text, base64) without rehashing content.
+    """
     filename: str
-    content: bytes
+    content: bytes | memoryview
     mime_type: str
     canonical_order: int
+    sha256: str | None = None
 
+    @classmethod
+    def from_path(
+        cls,
+        path: Path,
+        mime_type: str,
+        canonical_order: int,
+        filename: str | None = None,
+        sha256: str | None = None,
+    ) -> FilePayload:
+        """Map a file read-only instead of copying it onto the heap."""
+        with open(path, "rb") as f:
+            try:
+                content = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+            except ValueError:  # empty files cannot be mapped
+                content = b""
+        return cls(
+            filename=filename or path.name,
+            content=content,
+            mime_type=mime_type,
+            canonical_order=canonical_order,
+            sha256=sha256,
+        )
 
-@dataclass 
+
+@dataclass(slots=True, frozen=True)
 class MessagePayload:
     """A message to be sent to an interpreter, with optional file attachments."""
     text: str
-    files: list[FilePayload] | None = None
+    files: tuple[FilePayload, ...] | None = None
+
+
+@functools.lru_cache(maxsize=4096)
+def _hash_prompt_cached(prompt: str) -> str:
+    # usedforsecurity=False skips the FIPS policy wrapper; the digest is identical.
+    return hashlib.sha256(prompt.encode("utf-8"), usedforsecurity=False).hexdigest()
 
 
 class InterpreterProvider(ABC):
@@ -100,8 +138,11 @@ class InterpreterProvider(ABC):
     
     @staticmethod
     def hash_prompt(prompt: str) -> str:
-        """SHA-256 of the exact prompt text, for audit trail."""
-        return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        """
+        SHA-256 of the exact prompt text, for audit trail.
+        Memoized: the same fixed prompts are hashed for every run.
+        """
+        return _hash_prompt_cached(prompt)
 
 
 class ProviderRegistry:
@@ -111,23 +152,32 @@ class ProviderRegistry:
     """
     
     _providers: dict[str, type[InterpreterProvider]] = {}
+    _frozen: tuple[str, ...] | None = None
     
     @classmethod
     def register(cls, name: str, provider_class: type[InterpreterProvider]) -> None:
         cls._providers[name] = provider_class
+        cls._frozen = None  # Late registration invalidates the snapshot
+    
+    @classmethod
+    def freeze(cls) -> tuple[str, ...]:
+        """Snapshot provider names once registration is complete."""
+        cls._frozen = tuple(cls._providers)
+        return cls._frozen
     
     @classmethod
     def get(cls, name: str) -> type[InterpreterProvider]:
-        if name not in cls._providers:
-            available = ", ".join(cls._providers.keys())
+        try:
+            return cls._providers[name]
+        except KeyError:
+            available = ", ".join(cls._providers)
             raise ValueError(
                 f"Unknown provider '{name}'. Available: {available}"
-            )
-        return cls._providers[name]
+            ) from None
     
     @classmethod
-    def list_available(cls) -> list[str]:
-        return list(cls._providers.keys())
+    def list_available(cls) -> tuple[str, ...]:
+        return cls._frozen if cls._frozen is not None else tuple(cls._providers)
     
     @classmethod
     def create(cls, config: InterpreterConfig) -> InterpreterProvider:
@@ -9,18 +9,33 @@ import os
 from dotenv import load_dotenv
 load_dotenv()
 
+import asyncio
+import hashlib
+import io
 import logging
-from contextlib import asynccontextmanager
+import shutil
+import ssl
+import time
+import uuid
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from contextlib import asynccontextmanager, suppress
 from pathlib import Path
 from typing import Optional
 
-from fastapi import FastAPI, File, Form, HTTPException, UploadFile
+import aiofiles
+import httpx
+import orjson
+from fastapi import FastAPI, File, Form, HTTPException, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
+from fastapi.responses import ORJSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
 from pydantic import BaseModel
 
 from .models.schema import (
     ArchitecturalStatus,
+    DetectedMode,
     InterpreterConfig,
     SessionType,
     VerificationSession,
@@ -31,6 +46,8 @@ from .services.orchestrator import SessionOrchestrator
 # Import providers to trigger registration
 from .providers import anthropic_provider, openai_provider, ollama_provider, deepseek_provider  # noqa: F401
 from .core.gateway import ProviderRegistry
+from .providers import _extract_pool as extract_pool
+from .providers import _http as provider_http
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -40,6 +57,19 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path("data")
 UPLOAD_DIR = DATA_DIR / "uploads"
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
+# In-flight uploads; same filesystem as UPLOAD_DIR so os.replace is atomic
+UPLOAD_TMP_DIR = DATA_DIR / "uploads.tmp"
+UPLOAD_TMP_DIR.mkdir(parents=True, exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+UPLOAD_CONCURRENCY = 8  # Bounds open file descriptors across concurrent uploads
+EXPORT_CHUNK_SIZE = 1 << 16  # 64 KiB per streamed ZIP chunk
+EXPORT_CONCURRENCY = 4  # ZIP builder threads; further exports wait for a free one
+EXPORT_ABORT_POLL = 0.5  # Seconds a blocked ZIP builder waits before re-checking for abort
+# Already-compressed formats are stored as-is; deflating them only burns CPU
+EXPORT_STORED_EXTS = frozenset({
+    ".pdf", ".png", ".jpg", ".jpeg", ".gif", ".webp", ".zip", ".gz", ".bz2", ".xz",
+    ".7z", ".docx", ".xlsx", ".pptx", ".odt", ".epub", ".mp3", ".mp4", ".webm",
+})
 
 # в”Ђв”Ђв”Ђ Services в”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђ
 
@@ -53,7 +83,33 @@ async def lifespan(app: FastAPI):
     logger.info("ECR-VP Execution Shell starting...")
     logger.info(f"Data directory: {DATA_DIR.absolute()}")
     logger.info(f"Available providers: {ProviderRegistry.list_available()}")
+    # Corpus hashing goes through hashlib's OpenSSL backend; SHA-NI dispatch
+    # (several times faster SHA-256) needs OpenSSL 3.x on a supporting CPU
+    logger.info(f"Hash backend: {ssl.OPENSSL_VERSION}")
+    if ssl.OPENSSL_VERSION_INFO < (3,):
+        logger.warning("OpenSSL < 3.0: corpus hashing may not use SHA-NI acceleration")
+    # Shared outbound client: keep-alive connections are reused across requests
+    app.state.http = httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=20,
+            keepalive_expiry=300,
+        ),
+        http2=True,
+    )
+    # Providers register at import time, so these never change while serving
+    app.state.providers = ProviderRegistry.freeze()
+    app.state.health = HealthResponse(
+        status="ok",
+        providers=list(app.state.providers),
+        data_dir=str(DATA_DIR.absolute()),
+    )
     yield
+    await app.state.http.aclose()
+    await provider_http.aclose()
+    extract_pool.shutdown()
+    _export_executor.shutdown(wait=False, cancel_futures=True)
     logger.info("ECR-VP Execution Shell shutting down.")
 
 
@@ -66,8 +122,39 @@ app = FastAPI(
     ),
     version="0.1.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Headers a 304 must repeat from the 200 it stands for (RFC 9110, 15.4.5)
+_NOT_MODIFIED_HEADERS = ("cache-control", "content-location", "date", "expires", "vary")
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """Tag JSON GET responses by content and answer matching revalidations with 304."""
+
+    async def dispatch(self, request: Request, call_next):
+        response = await call_next(request)
+        path = request.url.path
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or not path.startswith("/api/")
+            or "etag" in response.headers
+            or response.headers.get("content-type") != "application/json"
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        if request.headers.get("if-none-match") == etag:
+            kept = {k: v for k in _NOT_MODIFIED_HEADERS if (v := response.headers.get(k)) is not None}
+            return Response(status_code=304, headers={**kept, "ETag": etag})
+        headers = dict(response.headers)
+        headers["etag"] = etag
+        return Response(body, status_code=response.status_code, headers=headers)
+
+
+app.add_middleware(ETagMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000", "http://localhost:5173"],
@@ -104,15 +191,80 @@ class HealthResponse(BaseModel):
     data_dir: str
 
 
+class PassportSummary(BaseModel):
+    passport_id: str
+    created_at: str
+    purpose: str
+    architectural_status: ArchitecturalStatus
+    canon_version: str
+    files_count: int
+
+
+class PassportList(BaseModel):
+    passports: list[PassportSummary]
+
+
+class RunResponseDetail(BaseModel):
+    run_id: str
+    provider: str
+    model: str
+    raw_text: str
+    captured_at: str
+    token_count_input: Optional[int] = None
+    token_count_output: Optional[int] = None
+    detected_modes: list[DetectedMode]
+    missing_modes: list[str]
+    modes_in_order: Optional[bool] = None
+
+
+class RunSummary(BaseModel):
+    run_id: str
+    provider: str
+    model: str
+    state: str
+    error: Optional[str] = None
+    modes_detected: list[str]
+    modes_missing: list[str]
+
+
+class ExecuteSessionResponse(BaseModel):
+    session_id: str
+    state: str
+    runs: list[RunSummary]
+
+
+def _run_summary(r) -> RunSummary:
+    resp = r.response
+    return RunSummary.model_construct(
+        run_id=r.run_id,
+        provider=r.interpreter.provider,
+        model=r.interpreter.model,
+        state=r.state.value,
+        error=r.error,
+        modes_detected=[m.mode for m in resp.detected_modes] if resp else [],
+        modes_missing=resp.missing_modes if resp else [],
+    )
+
+
+def _dump_json(model: BaseModel) -> bytes:
+    """
+    Serialize a model in one pass. orjson writes datetimes as isoformat()
+    does ("+00:00", not the "Z" of model_dump_json), so responses keep the
+    wire format jsonable_encoder produced.
+    """
+    return orjson.dumps(model.model_dump())
+
+
+def _json_response(model: BaseModel) -> Response:
+    """Serialize a model once, without FastAPI's jsonable_encoder pass."""
+    return Response(_dump_json(model), media_type="application/json")
+
+
 # в”Ђв”Ђв”Ђ Routes: Health в”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђ
 
 @app.get("/api/health", response_model=HealthResponse)
 async def health():
-    return HealthResponse(
-        status="ok",
-        providers=ProviderRegistry.list_available(),
-        data_dir=str(DATA_DIR.absolute()),
-    )
+    return app.state.health
 
 
 # в”Ђв”Ђв”Ђ Routes: License Validation в”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђ
@@ -121,6 +273,29 @@ class ValidateLicenseRequest(BaseModel):
     license_key: str
     instance_name: Optional[str] = "ecr-vp-shell"
 
+
+LICENSE_API_ATTEMPTS = 3
+LICENSE_API_BACKOFF = 0.25  # Seconds; doubled after each failed attempt
+LICENSE_CACHE_TTL = 300.0  # Seconds a successful validation is reused
+
+# sha256(license_key, instance_name) -> (monotonic expiry, response);
+# in-memory only, and the raw key is never kept
+_license_cache: dict[str, tuple[float, dict]] = {}
+
+
+async def _post_with_retry(url: str, payload: dict) -> httpx.Response:
+    """POST via the shared client, retrying transport failures with backoff."""
+    delay = LICENSE_API_BACKOFF
+    for attempt in range(1, LICENSE_API_ATTEMPTS + 1):
+        try:
+            return await app.state.http.post(url, json=payload)
+        except httpx.TransportError as e:
+            if attempt == LICENSE_API_ATTEMPTS:
+                raise
+            logger.info(f"License API attempt {attempt} failed ({e!r}), retrying in {delay}s")
+            await asyncio.sleep(delay)
+            delay *= 2
+
 @app.post("/api/license/validate")
 async def validate_license(req: ValidateLicenseRequest):
     """
@@ -133,8 +308,6 @@ async def validate_license(req: ValidateLicenseRequest):
     Dev bypass: ECR-VP-DEV-2025 works on localhost before store activation.
     Remove or change this key before production release.
     """
-    import httpx
-    
     # Dev bypass for testing before store activation
     DEV_KEY = "ECR-VP-DEV-2025"
     if req.license_key == DEV_KEY:
@@ -149,32 +322,43 @@ async def validate_license(req: ValidateLicenseRequest):
             "expires_at": None,
         }
     
+    cache_key = hashlib.sha256(
+        f"{req.license_key}\0{req.instance_name}".encode("utf-8")
+    ).hexdigest()
+    now = time.monotonic()
+    cached = _license_cache.get(cache_key)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(
-                "https://api.lemonsqueezy.com/v1/licenses/validate",
-                json={
-                    "license_key": req.license_key,
-                    "instance_name": req.instance_name,
-                },
-            )
-            data = resp.json()
-            
-            if data.get("valid"):
-                return {
-                    "valid": True,
-                    "license_key_short": req.license_key[:5] + "..." + req.license_key[-4:],
-                    "status": data.get("license_key", {}).get("status", "active"),
-                    "customer_name": data.get("meta", {}).get("customer_name"),
-                    "product_name": data.get("meta", {}).get("product_name"),
-                    "variant_name": data.get("meta", {}).get("variant_name"),
-                    "expires_at": data.get("license_key", {}).get("expires_at"),
-                }
-            else:
-                return {
-                    "valid": False,
-                    "error": data.get("error", "Invalid or expired license key"),
-                }
+        resp = await _post_with_retry(
+            "https://api.lemonsqueezy.com/v1/licenses/validate",
+            {
+                "license_key": req.license_key,
+                "instance_name": req.instance_name,
+            },
+        )
+        data = resp.json()
+        
+        if data.get("valid"):
+            result = {
+                "valid": True,
+                "license_key_short": req.license_key[:5] + "..." + req.license_key[-4:],
+                "status": data.get("license_key", {}).get("status", "active"),
+                "customer_name": data.get("meta", {}).get("customer_name"),
+                "product_name": data.get("meta", {}).get("product_name"),
+                "variant_name": data.get("meta", {}).get("variant_name"),
+                "expires_at": data.get("license_key", {}).get("expires_at"),
+            }
+            for key in [k for k, (expiry, _) in _license_cache.items() if expiry <= now]:
+                del _license_cache[key]
+            _license_cache[cache_key] = (now + LICENSE_CACHE_TTL, result)
+            return result
+        else:
+            return {
+                "valid": False,
+                "error": data.get("error", "Invalid or expired license key"),
+            }
     except httpx.TimeoutException:
         # If LemonSqueezy is unreachable, allow grace period
         logger.warning("LemonSqueezy API timeout вЂ” granting grace access")
@@ -190,49 +374,112 @@ async def validate_license(req: ValidateLicenseRequest):
 
 # в”Ђв”Ђв”Ђ Routes: File Upload в”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђ
 
+_upload_slots = asyncio.Semaphore(UPLOAD_CONCURRENCY)
+
+# (UPLOAD_DIR st_mtime_ns, sorted listing); dropped on upload/delete as well,
+# since overwriting an existing file leaves the directory mtime unchanged
+_LIST_CACHE: tuple[int, list[dict]] | None = None
+_UPLOAD_ROOT = os.path.realpath(UPLOAD_DIR) + os.sep
+
+
+def _resolve_upload(name: str) -> str:
+    """Absolute path of an uploaded file; rejects names escaping UPLOAD_DIR."""
+    path = os.path.realpath(os.path.join(_UPLOAD_ROOT, name))
+    if not path.startswith(_UPLOAD_ROOT):
+        raise HTTPException(400, f"Invalid file name: {name}")
+    return path
+
+
+def _list_uploads() -> list[dict]:
+    """Sorted listing of uploaded files, rescanned only when the directory changes."""
+    global _LIST_CACHE
+    mtime_ns = UPLOAD_DIR.stat().st_mtime_ns
+    if _LIST_CACHE is not None and _LIST_CACHE[0] == mtime_ns:
+        return _LIST_CACHE[1]
+    with os.scandir(UPLOAD_DIR) as it:
+        files = [
+            {
+                "filename": entry.name,
+                "size_bytes": entry.stat(follow_symlinks=False).st_size,
+                "file_id": entry.name,
+            }
+            for entry in it
+            if entry.is_file()
+        ]
+    files.sort(key=lambda f: f["filename"])
+    _LIST_CACHE = (mtime_ns, files)
+    return files
+
+
+async def _persist_upload(file: UploadFile) -> tuple[str, dict]:
+    """
+    Stream one upload to a private temp file; peak memory is one chunk.
+    Returns the temp path and the upload's entry; the caller moves it
+    into place.
+    """
+    # Client-supplied name: drop any directory part, then apply the same
+    # realpath guard as delete and export
+    filename = os.path.basename(file.filename or "")
+    file_path = _resolve_upload(filename)
+    tmp_path = str(UPLOAD_TMP_DIR / f"{uuid.uuid4().hex}.part")
+    size = 0
+    try:
+        async with _upload_slots:
+            async with aiofiles.open(tmp_path, "wb") as out:
+                while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                    await out.write(chunk)
+                    size += len(chunk)
+    except BaseException:
+        with suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+    return tmp_path, {
+        "filename": filename,
+        "size_bytes": size,
+        "file_id": filename,  # Simple ID for now
+        "path": file_path,
+    }
+
+
 @app.post("/api/files/upload")
 async def upload_files(files: list[UploadFile] = File(...)):
     """Upload corpus files. Returns file IDs for passport creation."""
-    uploaded = []
-    for file in files:
-        # Save to upload directory
-        file_path = UPLOAD_DIR / file.filename
-        content = await file.read()
-        file_path.write_bytes(content)
-        
-        uploaded.append({
-            "filename": file.filename,
-            "size_bytes": len(content),
-            "file_id": file.filename,  # Simple ID for now
-            "path": str(file_path),
-        })
-    
-    return {"uploaded": uploaded}
+    global _LIST_CACHE
+    # Parts are written concurrently, each to its own temp file, so two
+    # parts with the same name never interleave in one file
+    results = await asyncio.gather(*(_persist_upload(f) for f in files), return_exceptions=True)
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        for r in results:
+            if not isinstance(r, BaseException):
+                with suppress(OSError):
+                    os.unlink(r[0])
+        raise errors[0]
+    # Move into place in request order: as with sequential writes, the
+    # last part with a given name wins
+    for tmp_path, info in results:
+        os.replace(tmp_path, info["path"])
+    _LIST_CACHE = None
+    return {"uploaded": [info for _, info in results]}
 
 
 @app.get("/api/files")
 async def list_uploaded_files():
     """List all uploaded files available for corpus creation."""
-    files = []
-    for f in sorted(UPLOAD_DIR.iterdir()):
-        if f.is_file():
-            files.append({
-                "filename": f.name,
-                "size_bytes": f.stat().st_size,
-                "file_id": f.name,
-            })
-    return {"files": files}
+    return {"files": await asyncio.to_thread(_list_uploads)}
 
 
 @app.delete("/api/files/{file_id}")
 async def delete_uploaded_file(file_id: str):
     """Delete an uploaded file from the corpus staging area."""
+    global _LIST_CACHE
     import urllib.parse
     decoded = urllib.parse.unquote(file_id)
-    file_path = UPLOAD_DIR / decoded
-    if not file_path.exists():
+    try:
+        await asyncio.to_thread(os.unlink, _resolve_upload(decoded))
+    except (FileNotFoundError, IsADirectoryError):  # Only files are uploads
         raise HTTPException(404, f"File not found: {decoded}")
-    file_path.unlink()
+    _LIST_CACHE = None
     return {"deleted": decoded}
 
 
@@ -241,26 +488,30 @@ async def delete_uploaded_file(file_id: str):
 @app.post("/api/passports")
 async def create_passport(request: CreatePassportRequest):
     """Create a Corpus Passport (Canon Lock)."""
+    # One (cached) directory scan answers every existence check below
+    uploads = await asyncio.to_thread(_list_uploads)
+    
     # If no file_ids provided, use ALL uploaded files
     file_ids = request.file_ids
     if not file_ids:
-        file_ids = [f.name for f in sorted(UPLOAD_DIR.iterdir()) if f.is_file()]
+        file_ids = [f["file_id"] for f in uploads]
     
     if not file_ids:
         raise HTTPException(400, "No files uploaded. Upload files first.")
     
-    # Resolve file paths
-    file_paths = []
-    for file_id in file_ids:
-        path = UPLOAD_DIR / file_id
-        if not path.exists():
-            raise HTTPException(404, f"File not found: {file_id}")
-        file_paths.append(path)
+    # Resolve file paths; plain directory entries cannot escape UPLOAD_DIR
+    existing = {f["file_id"] for f in uploads}
+    missing = [file_id for file_id in file_ids if file_id not in existing]
+    if missing:
+        raise HTTPException(404, f"File not found: {', '.join(missing)}")
+    file_paths = [UPLOAD_DIR / file_id for file_id in file_ids]
     
     logger.info(f"Creating passport with {len(file_paths)} files")
     
     try:
-        passport = corpus_service.create_passport(
+        # Hashing and copying are blocking; keep the event loop free
+        passport = await asyncio.to_thread(
+            corpus_service.create_passport,
             files=file_paths,
             purpose=request.purpose,
             architectural_status=request.architectural_status,
@@ -269,7 +520,7 @@ async def create_passport(request: CreatePassportRequest):
         )
         return {
             "passport_id": passport.passport_id,
-            "created_at": passport.created_at.isoformat(),
+            "created_at": passport.created_at,
             "files_count": len(passport.files),
             "is_locked": passport.is_locked,
         }
@@ -280,46 +531,122 @@ async def create_passport(request: CreatePassportRequest):
 @app.get("/api/passports")
 async def list_passports():
     """List all corpus passports."""
-    passports = corpus_service.list_passports()
-    return {
-        "passports": [
-            {
-                "passport_id": p.passport_id,
-                "created_at": p.created_at.isoformat(),
-                "purpose": p.purpose,
-                "architectural_status": p.architectural_status.value,
-                "canon_version": p.canon_version,
-                "files_count": len(p.files),
-            }
-            for p in passports
-        ]
-    }
+    # Header fields come from the passport index; no passport.json is parsed
+    summaries = await asyncio.to_thread(corpus_service.list_passports_summary)
+    # Internal data is already validated; model_construct skips re-validation
+    return _json_response(PassportList.model_construct(passports=[
+        PassportSummary.model_construct(
+            **{**s, "architectural_status": ArchitecturalStatus(s["architectural_status"])}
+        )
+        for s in summaries
+    ]))
+
+
+# Serialized locked passports and their ETags; a locked passport is
+# immutable by contract
+_passport_json_cache: dict[str, tuple[bytes, str]] = {}
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    return request.headers.get("if-none-match") == etag
+
+
+def _accepted_encodings(header: str) -> tuple[set[str], set[str], bool]:
+    """
+    Parse Accept-Encoding into (accepted, refused, wildcard): codings with
+    q > 0, codings with q=0, and whether "*" accepts codings not listed.
+    """
+    accepted: set[str] = set()
+    refused: set[str] = set()
+    wildcard = False
+    for item in header.split(","):
+        coding, *params = item.split(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0  # Malformed weight: do not assume the coding is wanted
+        if coding == "*":
+            wildcard = q > 0
+        elif q > 0:
+            accepted.add(coding)
+        else:
+            refused.add(coding)
+    return accepted, refused, wildcard
 
 
 @app.get("/api/passports/{passport_id}")
-async def get_passport(passport_id: str):
+async def get_passport(passport_id: str, request: Request):
     """Get full passport details."""
+    cached = _passport_json_cache.get(passport_id)
+    if cached is None:
+        try:
+            passport = corpus_service.load_passport(passport_id)
+        except FileNotFoundError:
+            raise HTTPException(404, f"Passport not found: {passport_id}")
+        body = _dump_json(passport)
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        cached = (body, etag)
+        if passport.is_locked:
+            _passport_json_cache[passport_id] = cached
+    body, etag = cached
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
+
+
+@app.get("/api/passports/{passport_id}/verify")
+async def verify_passport_integrity(passport_id: str, order: Optional[int] = None):
+    """
+    Verify SHA-256 integrity of all corpus files. With ?order=N, spot-check
+    only the file at that canonical order against the sealed Merkle root:
+    one file read instead of rehashing the corpus.
+    """
     try:
         passport = corpus_service.load_passport(passport_id)
-        return passport.model_dump()
     except FileNotFoundError:
         raise HTTPException(404, f"Passport not found: {passport_id}")
+    if order is not None:
+        return await _verify_one_file(passport, order)
+    integrity = await corpus_service.verify_integrity_async(passport)
+    # Files match the passport's hashes; the hashes must match the seal
+    merkle_ok = corpus_service.verify_merkle_root(passport)
+    all_ok = all(integrity.values()) and merkle_ok is not False
+    return {
+        "passport_id": passport_id,
+        "integrity_ok": all_ok,
+        "merkle_root_ok": merkle_ok,
+        "files": integrity,
+    }
 
 
-@app.get("/api/passports/{passport_id}/verify")
-async def verify_passport_integrity(passport_id: str):
-    """Verify SHA-256 integrity of all corpus files."""
+async def _verify_one_file(passport, order: int) -> dict:
+    cf = next((f for f in passport.files if f.canonical_order == order), None)
+    if cf is None:
+        raise HTTPException(404, f"No corpus file with canonical order {order}")
+    if not passport.merkle_root:
+        raise HTTPException(409, "Passport has no sealed Merkle root; verify the whole corpus instead")
     try:
-        passport = corpus_service.load_passport(passport_id)
-        integrity = corpus_service.verify_integrity(passport)
-        all_ok = all(integrity.values())
-        return {
-            "passport_id": passport_id,
-            "integrity_ok": all_ok,
-            "files": integrity,
-        }
+        # Reads merkle_tree.json and the file; both off the event loop
+        ok, merkle_ok, proof = await asyncio.to_thread(corpus_service.verify_file, passport, order)
     except FileNotFoundError:
-        raise HTTPException(404, f"Passport not found: {passport_id}")
+        raise HTTPException(404, f"Merkle tree not found for passport: {passport.passport_id}")
+    if ok is None:
+        raise HTTPException(404, f"Corpus file missing from disk: {cf.filename}")
+    return {
+        "passport_id": passport.passport_id,
+        "integrity_ok": ok,
+        "merkle_root_ok": merkle_ok,
+        "files": {cf.filename: ok},
+        # Sibling path to the root, so clients can check the file themselves
+        "proof": [{"hash": h, "side": side} for h, side in proof],
+    }
 
 
 # в”Ђв”Ђв”Ђ Routes: Sessions в”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђ
@@ -361,25 +688,11 @@ async def execute_session(session_id: str, request: ExecuteSessionRequest):
     
     try:
         session = await orchestrator.execute_session(session, parallel=request.parallel)
-        return {
-            "session_id": session.session_id,
-            "state": session.state.value,
-            "runs": [
-                {
-                    "run_id": r.run_id,
-                    "provider": r.interpreter.provider,
-                    "model": r.interpreter.model,
-                    "state": r.state.value,
-                    "error": r.error,
-                    "modes_detected": (
-                        [m.mode for m in r.response.detected_modes]
-                        if r.response else []
-                    ),
-                    "modes_missing": r.response.missing_modes if r.response else [],
-                }
-                for r in session.runs
-            ],
-        }
+        return _json_response(ExecuteSessionResponse.model_construct(
+            session_id=session.session_id,
+            state=session.state.value,
+            runs=[_run_summary(r) for r in session.runs],
+        ))
     except Exception as e:
         raise HTTPException(500, str(e))
 
@@ -391,13 +704,17 @@ async def list_sessions():
 
 
 @app.get("/api/sessions/{session_id}")
-async def get_session(session_id: str):
+async def get_session(session_id: str, request: Request):
     """Get full session details including run results."""
     try:
+        # Validate polls from the file's stat before loading or serializing
+        etag = f'W/"{orchestrator.session_version(session_id)}"'
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
         session = orchestrator.load_session(session_id)
-        return session.model_dump()
     except FileNotFoundError:
         raise HTTPException(404, f"Session not found: {session_id}")
+    return Response(_dump_json(session), media_type="application/json", headers={"ETag": etag})
 
 
 @app.get("/api/sessions/{session_id}/runs/{run_id}/response")
@@ -415,18 +732,18 @@ async def get_run_response(session_id: str, run_id: str):
     if not run.response:
         raise HTTPException(404, "No response captured for this run")
     
-    return {
-        "run_id": run_id,
-        "provider": run.interpreter.provider,
-        "model": run.interpreter.model,
-        "raw_text": run.response.raw_text,
-        "captured_at": run.response.captured_at.isoformat(),
-        "token_count_input": run.response.token_count_input,
-        "token_count_output": run.response.token_count_output,
-        "detected_modes": [m.model_dump() for m in run.response.detected_modes],
-        "missing_modes": run.response.missing_modes,
-        "modes_in_order": run.response.modes_in_order,
-    }
+    return _json_response(RunResponseDetail.model_construct(
+        run_id=run_id,
+        provider=run.interpreter.provider,
+        model=run.interpreter.model,
+        raw_text=run.response.raw_text,
+        captured_at=run.response.captured_at.isoformat(),
+        token_count_input=run.response.token_count_input,
+        token_count_output=run.response.token_count_output,
+        detected_modes=run.response.detected_modes,
+        missing_modes=run.response.missing_modes,
+        modes_in_order=run.response.modes_in_order,
+    ))
 
 
 # в”Ђв”Ђв”Ђ Routes: Providers в”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђ
@@ -434,7 +751,7 @@ async def get_run_response(session_id: str, run_id: str):
 @app.get("/api/providers")
 async def list_providers():
     """List available LLM providers."""
-    return {"providers": ProviderRegistry.list_available()}
+    return {"providers": app.state.providers}
 
 @app.get("/api/providers/status")
 async def provider_status():
@@ -471,13 +788,115 @@ async def provider_status():
 
 # в”Ђв”Ђв”Ђ Routes: Export в”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђв”Ђ
 
+class _ZipStreamSink(io.RawIOBase):
+    """Unseekable ZIP sink that hands output to the event loop in chunks."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, queue: asyncio.Queue):
+        super().__init__()
+        self._loop = loop
+        self._queue = queue
+        self._buf = bytearray()
+        self.aborted = False
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        if self.aborted:
+            raise OSError("Export stream closed by client")
+        n = len(b)
+        if not self._buf and n >= EXPORT_CHUNK_SIZE:
+            # Large payload write: hand it over without staging in the buffer
+            self._put(bytes(b))
+            return n
+        self._buf += b
+        if len(self._buf) >= EXPORT_CHUNK_SIZE:
+            self._emit()
+        return n
+
+    def flush(self) -> None:
+        if self._buf and not self.aborted:
+            self._emit()
+
+    def _emit(self) -> None:
+        data = bytes(self._buf)
+        self._buf.clear()
+        self._put(data)
+
+    def _put(self, data: Optional[bytes]) -> None:
+        # Blocks the producer thread while the queue is full (backpressure),
+        # waking periodically so an abandoned download releases the thread
+        future = asyncio.run_coroutine_threadsafe(self._queue.put(data), self._loop)
+        while True:
+            try:
+                future.result(timeout=EXPORT_ABORT_POLL)
+                return
+            except FutureTimeoutError:
+                if self.aborted:
+                    future.cancel()
+                    raise OSError("Export stream closed by client") from None
+
+
+# ZIP builders get their own threads: a slow download holds one for its whole
+# duration and must not starve asyncio.to_thread users of the default pool
+_export_executor = ThreadPoolExecutor(max_workers=EXPORT_CONCURRENCY, thread_name_prefix="export")
+
+
+def _collect_producer(future: asyncio.Future) -> None:
+    """Retrieve the outcome of a ZIP builder nobody awaits (aborted download)."""
+    if future.cancelled():
+        return
+    exc = future.exception()
+    if exc is not None and not isinstance(exc, OSError):
+        logger.warning(f"Export builder failed after the client left: {exc!r}")
+
+
+def _zip_write_file(zf: zipfile.ZipFile, path: str, arcname: str, compress_type: int) -> None:
+    """Like ZipFile.write, but copies in UPLOAD_CHUNK_SIZE blocks instead of 8 KiB."""
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = compress_type
+    with open(path, "rb") as src, zf.open(zinfo, "w") as dest:
+        shutil.copyfileobj(src, dest, UPLOAD_CHUNK_SIZE)
+
+
+def _leaf_hashes(texts: list[str]) -> list[str]:
+    """SHA-256 hex digest of each report text (Merkle leaves)."""
+    return [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+
+
+async def _stream_zip(write_entries):
+    """Yield a ZIP archive as it is built, without buffering the whole bundle."""
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=8)
+    sink = _ZipStreamSink(loop, queue)
+
+    def produce() -> None:
+        try:
+            with zipfile.ZipFile(sink, "w", zipfile.ZIP_DEFLATED) as zf:
+                write_entries(zf)
+        finally:
+            if not sink.aborted:
+                sink._put(None)
+
+    producer = loop.run_in_executor(_export_executor, produce)
+    finished = False
+    try:
+        while (chunk := await queue.get()) is not None:
+            yield chunk
+        finished = True
+    finally:
+        if not finished:
+            # Client went away (generator closed or cancelled): no awaiting
+            # here. The producer notices the flag on its next write or within
+            # EXPORT_ABORT_POLL, and the callback retrieves its exception.
+            sink.aborted = True
+            producer.add_done_callback(_collect_producer)
+    await producer
+
+
 @app.get("/api/sessions/{session_id}/export")
 async def export_session(session_id: str):
     """Export a verification session as a ZIP bundle."""
-    import hashlib
-    import json
-    import io
-    import zipfile
     from datetime import datetime, timezone
     from fastapi.responses import StreamingResponse
     
@@ -488,75 +907,83 @@ async def export_session(session_id: str):
     
     passport = session.passport  # CorpusPassport object
     
-    # Build Merkle tree from run outputs
-    leaf_hashes = []
-    run_reports = []
-    
-    for run in session.runs:
-        if run.response and run.response.raw_text:
-            text = run.response.raw_text
-            h = hashlib.sha256(text.encode("utf-8")).hexdigest()
-            leaf_hashes.append(h)
-            run_reports.append({
-                "run_id": run.run_id,
-                "provider": run.interpreter.provider,
-                "model": run.interpreter.model,
-                "hash": h,
-                "captured_at": run.response.captured_at.isoformat() if run.response.captured_at else None,
-                "tokens_in": run.response.token_count_input,
-                "tokens_out": run.response.token_count_output,
-                "detected_modes": [m.model_dump() for m in run.response.detected_modes],
-                "missing_modes": run.response.missing_modes,
-            })
+    # Build Merkle tree from run outputs; each leaf is hashed exactly once
+    answered = [run for run in session.runs if run.response and run.response.raw_text]
+    # Large sessions carry MBs of report text; hash it off the event loop
+    leaf_hashes = await asyncio.to_thread(
+        _leaf_hashes, [run.response.raw_text for run in answered]
+    )
+    run_reports = [
+        {
+            "run_id": run.run_id,
+            "provider": run.interpreter.provider,
+            "model": run.interpreter.model,
+            "hash": h,
+            "captured_at": run.response.captured_at,
+            "tokens_in": run.response.token_count_input,
+            "tokens_out": run.response.token_count_output,
+            "detected_modes": [m.model_dump() for m in run.response.detected_modes],
+            "missing_modes": run.response.missing_modes,
+        }
+        for run, h in zip(answered, leaf_hashes)
+    ]
     
-    # Compute Merkle root
+    # Compute Merkle root (nodes hash the concatenated hex of their children)
     def merkle_root(hashes):
         if not hashes:
             return hashlib.sha256(b"empty").hexdigest()
-        level = list(hashes)
+        # Work on ASCII bytes so pairs concatenate without a str round-trip
+        level = [h.encode() for h in hashes]
         while len(level) > 1:
-            next_level = []
-            for i in range(0, len(level), 2):
-                left = level[i]
-                right = level[i + 1] if i + 1 < len(level) else left
-                combined = hashlib.sha256((left + right).encode()).hexdigest()
-                next_level.append(combined)
-            level = next_level
-        return level[0]
+            if len(level) % 2:
+                level.append(level[-1])
+            level = [
+                hashlib.sha256(level[i] + level[i + 1]).hexdigest().encode()
+                for i in range(0, len(level), 2)
+            ]
+        return level[0].decode()
     
     root = merkle_root(leaf_hashes)
     
     # Build manifest (use correct schema fields)
     manifest = {
         "ecr_vp_version": "1.0",
-        "export_timestamp": datetime.now(timezone.utc).isoformat(),
+        "export_timestamp": datetime.now(timezone.utc),
         "session_id": session_id,
         "passport_id": passport.passport_id,
         "state": session.state.value if hasattr(session.state, 'value') else str(session.state),
         "merkle_root": root,
         "leaf_hashes": leaf_hashes,
+        # Corpus seal from Canon Lock, and whether the passport still matches it
+        "corpus_merkle_root": passport.merkle_root,
+        "corpus_merkle_root_ok": corpus_service.verify_merkle_root(passport),
         "runs": run_reports,
     }
     
     # Serialize passport via pydantic
-    passport_dict = passport.model_dump(mode="json")
+    passport_json = passport.model_dump_json(indent=2)
     
-    # Create ZIP in memory
-    buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr("manifest.json", json.dumps(manifest, indent=2, ensure_ascii=False))
-        zf.writestr("passport.json", json.dumps(passport_dict, indent=2, ensure_ascii=False))
+    # Bundle entries; written from a worker thread while the response streams
+    def write_bundle(zf: zipfile.ZipFile) -> None:
+        zf.writestr("manifest.json", orjson.dumps(manifest, option=orjson.OPT_INDENT_2))
+        zf.writestr("passport.json", passport_json)
         
         # Corpus files
         for f in passport.files:
-            fpath = UPLOAD_DIR / f.filename
-            if fpath.exists():
-                zf.write(fpath, f"corpus/{f.filename}")
-            else:
+            arcname = f"corpus/{f.filename}"
+            method = (
+                zipfile.ZIP_STORED
+                if os.path.splitext(f.filename)[1].lower() in EXPORT_STORED_EXTS
+                else zipfile.ZIP_DEFLATED
+            )
+            try:
+                _zip_write_file(zf, _resolve_upload(f.filename), arcname, method)
+            except (FileNotFoundError, HTTPException):
                 # Try file_path
-                alt = Path(f.file_path)
-                if alt.exists():
-                    zf.write(alt, f"corpus/{f.filename}")
+                try:
+                    _zip_write_file(zf, f.file_path, arcname, method)
+                except FileNotFoundError:
+                    pass
         
         # Interpreter reports
         for run in session.runs:
@@ -568,19 +995,21 @@ async def export_session(session_id: str):
                 )
         
         # Merkle tree visualization
-        merkle_txt = f"ECR-VP Merkle Integrity Tree\n{'=' * 40}\n\n"
-        merkle_txt += f"Root: {root}\n\nLeaves:\n"
-        for i, h in enumerate(leaf_hashes):
-            rr = run_reports[i] if i < len(run_reports) else {}
-            merkle_txt += f"  [{i}] {h}  ({rr.get('provider', '?')}/{rr.get('model', '?')})\n"
+        merkle_txt = "".join([
+            f"ECR-VP Merkle Integrity Tree\n{'=' * 40}\n\n",
+            f"Root: {root}\n\nLeaves:\n",
+            *(
+                f"  [{i}] {h}  ({rr['provider']}/{rr['model']})\n"
+                for i, (h, rr) in enumerate(zip(leaf_hashes, run_reports))
+            ),
+        ])
         zf.writestr("merkle_tree.txt", merkle_txt)
     
-    buf.seek(0)
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = f"ECR-VP_session_{session_id[:8]}_{ts}.zip"
     
     return StreamingResponse(
-        buf,
+        _stream_zip(write_bundle),
         media_type="application/zip",
         headers={"Content-Disposition": f"attachment; filename={filename}"},
     )
@@ -592,15 +1021,85 @@ async def export_session(session_id: str):
 
 STATIC_DIR = Path(__file__).parent.parent / "static"
 if STATIC_DIR.is_dir():
+    import mimetypes
     from fastapi.responses import FileResponse
 
-    # Serve static assets
-    app.mount("/assets", StaticFiles(directory=STATIC_DIR / "assets"), name="assets")
+    ASSET_CACHE_MAX_BYTES = 4 << 20  # Larger assets are streamed from disk
+    IMMUTABLE = "public, max-age=31536000, immutable"
+    INDEX_PATH = STATIC_DIR / "index.html"
+
+    def _load_cached(path: Path) -> tuple[bytes, str, str]:
+        body = path.read_bytes()
+        content_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+        return body, content_type, etag
+
+    # Vite emits content-hashed filenames under /assets, so entries never go stale
+    _ASSET_CACHE: dict[str, tuple[bytes, str, str]] = {
+        p.relative_to(STATIC_DIR / "assets").as_posix(): _load_cached(p)
+        for p in (STATIC_DIR / "assets").rglob("*")
+        if p.is_file() and p.stat().st_size <= ASSET_CACHE_MAX_BYTES
+    } if (STATIC_DIR / "assets").is_dir() else {}
+    # Precompressed siblings written by build.sh (foo.js.br / foo.js.gz),
+    # keyed by (asset path, Content-Encoding) and typed as the original
+    _ENCODED_SUFFIXES = ((".br", "br"), (".gz", "gzip"))
+    _ASSET_ENCODED: dict[tuple[str, str], tuple[bytes, str, str]] = {
+        (path[: -len(suffix)], encoding): (body, _ASSET_CACHE[path[: -len(suffix)]][1], etag)
+        for path, (body, _, etag) in _ASSET_CACHE.items()
+        for suffix, encoding in _ENCODED_SUFFIXES
+        if path.endswith(suffix) and path[: -len(suffix)] in _ASSET_CACHE
+    }
+    _index_cache: dict[int, tuple[bytes, str, str]] = {}  # st_mtime_ns -> entry
+    # Top-level build outputs (favicons etc.); a built SPA never changes under us
+    _STATIC_FILES = frozenset(
+        p.relative_to(STATIC_DIR).as_posix() for p in STATIC_DIR.rglob("*") if p.is_file()
+    )
+
+    def _cached_response(
+        entry: tuple[bytes, str, str],
+        request: Request,
+        cache_control: str,
+        extra_headers: dict[str, str] | None = None,
+    ) -> Response:
+        body, content_type, etag = entry
+        headers = {"ETag": etag, "Cache-Control": cache_control, **(extra_headers or {})}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type=content_type, headers=headers)
+
+    @app.get("/assets/{path:path}")
+    async def serve_asset(path: str, request: Request):
+        entry = _ASSET_CACHE.get(path)
+        if entry is not None:
+            headers = {"Vary": "Accept-Encoding"}
+            accepted, refused, wildcard = _accepted_encodings(request.headers.get("accept-encoding", ""))
+            for _, encoding in _ENCODED_SUFFIXES:
+                encoded = _ASSET_ENCODED.get((path, encoding))
+                if encoded is not None and (
+                    encoding in accepted or (wildcard and encoding not in refused)
+                ):
+                    headers["Content-Encoding"] = encoding
+                    return _cached_response(encoded, request, IMMUTABLE, headers)
+            return _cached_response(entry, request, IMMUTABLE, headers)
+        file_path = STATIC_DIR / "assets" / path
+        if not file_path.resolve().is_relative_to(STATIC_DIR.resolve()) or not file_path.is_file():
+            raise HTTPException(404, "Not Found")
+        return FileResponse(file_path, headers={"Cache-Control": IMMUTABLE})
 
     # Serve index.html for all non-API routes (SPA routing)
     @app.get("/{full_path:path}")
-    async def serve_spa(full_path: str):
+    async def serve_spa(full_path: str, request: Request):
+        if full_path not in _STATIC_FILES:
+            # Revalidated on every hit; reloaded only when the build replaces it
+            mtime_ns = INDEX_PATH.stat().st_mtime_ns
+            entry = _index_cache.get(mtime_ns)
+            if entry is None:
+                _index_cache.clear()
+                entry = _index_cache[mtime_ns] = _load_cached(INDEX_PATH)
+            return _cached_response(entry, request, "no-cache")
         file_path = STATIC_DIR / full_path
-        if file_path.is_file():
-            return FileResponse(file_path)
-        return FileResponse(STATIC_DIR / "index.html")
+        st = file_path.stat()
+        etag = f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag})
+        return FileResponse(file_path, stat_result=st, headers={"ETag": etag})
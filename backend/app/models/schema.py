@@ -58,11 +58,17 @@ class ProtocolMode(str, Enum):
     MATURITY = "Project Maturity Summary"  # Operational readiness
 
     @classmethod
-    def prescribed_order(cls) -> list[ProtocolMode]:
-        return [
-            cls.RC, cls.RI, cls.DECLARATIVE_TYPOLOGY, cls.RA,
-            cls.FAILURE, cls.NOVELTY, cls.VERDICT, cls.MATURITY
-        ]
+    def prescribed_order(cls) -> tuple[ProtocolMode, ...]:
+        return _PRESCRIBED_ORDER
+
+
+# Built once; defined outside the class body, where it would become a member
+_PRESCRIBED_ORDER: tuple[ProtocolMode, ...] = (
+    ProtocolMode.RC, ProtocolMode.RI, ProtocolMode.DECLARATIVE_TYPOLOGY, ProtocolMode.RA,
+    ProtocolMode.FAILURE, ProtocolMode.NOVELTY, ProtocolMode.VERDICT, ProtocolMode.MATURITY
+)
+PRESCRIBED_MODE_VALUES: tuple[str, ...] = tuple(m.value for m in _PRESCRIBED_ORDER)
+PRESCRIBED_MODE_SET: frozenset[str] = frozenset(PRESCRIBED_MODE_VALUES)
 
 
 # ─── Corpus & Passport ───────────────────────────────────────────────
@@ -100,9 +106,15 @@ class CorpusPassport(BaseModel):
 
     # Integrity
     is_locked: bool = False
+    merkle_root: Optional[str] = Field(
+        default=None,
+        description="Merkle root over file hashes in canonical order, set at Canon Lock"
+    )
 
     def lock(self) -> None:
         """Once locked, passport is immutable for the session."""
+        # Freeze canonical order so readers can iterate files without sorting
+        self.files.sort(key=lambda f: f.canonical_order)
         self.is_locked = True
 
 
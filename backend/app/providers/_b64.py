@@ -0,0 +1,53 @@
+"""
+Base64 encoding of image attachments, cached by content hash.
+
+Every run of every session re-sends the same corpus images, so each one is
+encoded once and the string reused across providers and instances.
+"""
+
+from __future__ import annotations
+
+import binascii
+import threading
+from collections import OrderedDict
+
+from ._extract_cache import fingerprint
+from ..core.gateway import FilePayload
+
+IMAGE_B64_CACHE_SIZE = 32
+IMAGE_B64_CACHE_CHARS = 64 * 1024 * 1024  # Total cached base64 held in memory
+
+_cache: OrderedDict[str, str] = OrderedDict()
+_chars = 0
+_lock = threading.Lock()
+
+
+def b64(data: bytes | memoryview) -> str:
+    """Base64 text of data; b2a_base64 reads memoryviews without copying them."""
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
+
+
+def cached_b64(f: FilePayload, prefix: str = "") -> str:
+    """
+    Base64 text of an attachment, keyed by its corpus sha256 when known.
+    prefix (e.g. a data: URL header) is baked into the cached string, so
+    multi-MB payloads are not re-concatenated on every send.
+    """
+    global _chars
+    key = prefix + (f.sha256 or fingerprint(f.content))
+    with _lock:
+        data = _cache.get(key)
+        if data is not None:
+            _cache.move_to_end(key)
+            return data
+    data = prefix + b64(f.content)
+    if len(data) > IMAGE_B64_CACHE_CHARS:
+        return data  # Would evict everything else; encode it per send instead
+    with _lock:
+        if key not in _cache:
+            _cache[key] = data
+            _chars += len(data)
+            while len(_cache) > IMAGE_B64_CACHE_SIZE or _chars > IMAGE_B64_CACHE_CHARS:
+                _, evicted = _cache.popitem(last=False)
+                _chars -= len(evicted)
+    return data
@@ -0,0 +1,107 @@
+"""
+Shared base for providers speaking an OpenAI-style chat API.
+
+OpenAI, DeepSeek and Ollama all keep a per-session list of role/content
+messages and send it whole on the final turn. Session bookkeeping, the
+alternating-role preparation and attachment text extraction live here once.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import io
+from itertools import pairwise
+from typing import Iterable, Optional
+
+from ._extract_pool import extract_text
+from ._lazy import optional_import
+from ._pdf import extract_pdf_text
+from ._session_store import SessionStore
+from ..core.gateway import FilePayload, InterpreterProvider
+from ..models.schema import InterpreterConfig
+
+
+# Synthetic turn placed between consecutive user messages; shared, never mutated
+_ACK_MSG = {"role": "assistant", "content": "Acknowledged. Awaiting next corpus segment."}
+
+
+def extract_docx_text(content: bytes | memoryview, filename: str) -> Optional[str]:
+    """Extract paragraph text from DOCX bytes; runs in the extraction pool."""
+    docx = optional_import("docx")
+    if docx is None:
+        return None
+    try:
+        doc = docx.Document(io.BytesIO(content))
+        # p.text is rebuilt from runs on every access; read it once, and test
+        # blankness with isspace() rather than allocating a stripped copy
+        paragraphs = [t for p in doc.paragraphs if (t := p.text) and not t.isspace()]
+        if paragraphs:
+            # One join including the framing, so the body is copied only once
+            return "\n".join([f"--- File: {filename} ---", *paragraphs, f"--- End: {filename} ---"])
+    except Exception:
+        pass
+    return None
+
+
+class OpenAICompatibleProvider(InterpreterProvider):
+    """
+    Base for providers whose sessions are plain message lists.
+    Subclasses implement send_message / send_and_receive and the
+    capability queries.
+    """
+
+    def __init__(self, config: InterpreterConfig):
+        super().__init__(config)
+        self._store = SessionStore.instance()
+
+    async def create_session(self) -> str:
+        return self._store.create()
+
+    async def close_session(self, session_id: str) -> None:
+        self._store.pop(session_id)
+
+    def _prepare_messages(self, session_id: str) -> list[dict]:
+        raw = self._store.get(session_id)
+        n = len(raw)
+        # Short histories need no acknowledgements; skip the loop entirely
+        if n < 2 or (n == 2 and raw[0]["role"] != raw[1]["role"]):
+            return list(raw)
+        messages = []
+        append, extend = messages.append, messages.extend
+        # Single pass over neighbours; no index arithmetic or raw[i + 1] lookups
+        for cur, nxt in pairwise(raw):
+            if cur["role"] == "user" and nxt["role"] == "user":
+                extend((cur, _ACK_MSG))
+            else:
+                append(cur)
+        append(raw[-1])
+        return messages
+
+    @staticmethod
+    async def _extract_document(f: FilePayload) -> Optional[str]:
+        """Framed text of a PDF/DOCX attachment, or None for other files or on failure."""
+        name = f.filename.lower()
+        if name.endswith(".pdf"):
+            return await extract_text("pdf", f, extract_pdf_text)
+        if name.endswith(".docx"):
+            return await extract_text("docx", f, extract_docx_text)
+        return None
+
+    @classmethod
+    async def _document_texts(cls, files: Iterable[FilePayload]) -> list[str]:
+        """
+        Framed text of each attachment, in order. Documents are
+        extracted concurrently, so a multi-file segment fans out across
+        the extraction pool instead of parsing one file at a time.
+        """
+        files = list(files)
+        extracted = await asyncio.gather(*map(cls._extract_document, files))
+        return [text or cls._decode_text(f) for f, text in zip(files, extracted)]
+
+    @staticmethod
+    def _decode_text(f: FilePayload) -> str:
+        """Framed UTF-8 content, or a placeholder for binary files."""
+        try:
+            return f"--- File: {f.filename} ---\n{str(f.content, 'utf-8')}\n--- End: {f.filename} ---"
+        except UnicodeDecodeError:
+            return f"[Binary file: {f.filename}, could not extract text]"
@@ -0,0 +1,155 @@
+"""
+Content-addressed cache for text extracted from corpus attachments.
+
+The same corpus files are re-sent to every interpreter in every session, and
+PDF/DOCX parsing is the heaviest CPU work on that path. Results are kept in a
+bounded in-memory LRU and persisted next to the corpus data, so a given file
+is parsed once per installation rather than once per run.
+
+The disk copy is plaintext corpus content: it stays inside the data
+directory and is bounded by size and idle age. Entries are not dropped when
+an upload is deleted, since locked passports may hold the same content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional
+
+from ._lazy import optional_import
+
+logger = logging.getLogger(__name__)
+
+MAX_ENTRIES = 256
+MAX_CHARS = 64 * 1024 * 1024  # Total cached text held in memory
+# Same relative root as main.DATA_DIR, so cached text lives with the corpus
+CACHE_DIR = Path("data") / "cache" / "extract"
+MAX_DISK_BYTES = 1 << 30
+MAX_DISK_AGE = 30 * 24 * 3600.0  # Seconds since an entry was last read or written
+PRUNE_INTERVAL = 300.0  # Minimum seconds between disk prunes
+
+_entries: OrderedDict[str, str] = OrderedDict()
+_chars = 0
+_lock = threading.Lock()
+_last_prune = float("-inf")
+
+
+def fingerprint(content: bytes | memoryview) -> str:
+    """
+    Cache-only content fingerprint for payloads without a known corpus hash.
+    BLAKE3 (when installed) runs several times faster than SHA-256; the
+    prefix keeps its keys distinct from SHA-256 ones. Not for integrity.
+    """
+    blake3 = optional_import("blake3")
+    if blake3 is not None:
+        return "b3" + blake3.blake3(content).hexdigest(length=16)
+    return hashlib.sha256(content).hexdigest()
+
+
+def _key(content: bytes | memoryview, kind: str, filename: str, digest: Optional[str]) -> str:
+    # Extracted text embeds the filename in its framing, so it is part of the key
+    digest = digest or fingerprint(content)
+    name = hashlib.sha256(filename.encode("utf-8")).hexdigest()[:16]
+    return f"{digest}-{kind}-{name}"
+
+
+def _remember(key: str, text: str) -> None:
+    global _chars
+    with _lock:
+        if key in _entries:
+            _entries.move_to_end(key)
+            return
+        _entries[key] = text
+        _chars += len(text)
+        while _entries and (len(_entries) > MAX_ENTRIES or _chars > MAX_CHARS):
+            _, evicted = _entries.popitem(last=False)
+            _chars -= len(evicted)
+
+
+def _read_disk(key: str) -> Optional[str]:
+    path = CACHE_DIR / f"{key}.txt"
+    try:
+        text = path.read_text(encoding="utf-8")
+        os.utime(path)  # mtime tracks last use, for pruning
+        return text
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def _write_disk(key: str, text: str) -> None:
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp = CACHE_DIR / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, CACHE_DIR / f"{key}.txt")
+    except OSError as e:
+        logger.debug(f"Extract cache write failed for {key}: {e}")
+        return
+    global _last_prune
+    now = time.monotonic()
+    if now - _last_prune >= PRUNE_INTERVAL:
+        _last_prune = now
+        _prune_disk()
+
+
+def _prune_disk() -> None:
+    """
+    Delete disk entries (and stray temp files) unused for MAX_DISK_AGE, then
+    the least recently used ones while the total exceeds MAX_DISK_BYTES.
+    """
+    files = []
+    try:
+        with os.scandir(CACHE_DIR) as it:
+            for entry in it:
+                try:
+                    st = entry.stat()
+                except OSError:
+                    continue
+                files.append((st.st_mtime, st.st_size, entry.path))
+    except OSError:
+        return
+    files.sort()
+    total = sum(size for _, size, _ in files)
+    cutoff = time.time() - MAX_DISK_AGE
+    for mtime, size, path in files:
+        if mtime >= cutoff and total <= MAX_DISK_BYTES:
+            break
+        try:
+            os.unlink(path)
+        except OSError:
+            continue
+        total -= size
+
+
+def cached_extract(
+    kind: str,
+    content: bytes | memoryview,
+    filename: str,
+    extract: Callable[[], Optional[str]],
+    digest: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Return extract() for this content, computing it at most once per key.
+    kind distinguishes extractors; digest is the content's SHA-256 hex when
+    already known (FilePayload.sha256). Failed extractions (None) are not cached.
+    """
+    key = _key(content, kind, filename, digest)
+    with _lock:
+        text = _entries.get(key)
+        if text is not None:
+            _entries.move_to_end(key)
+            return text
+    text = _read_disk(key)
+    if text is None:
+        text = extract()
+        if text is None:
+            return None
+        _write_disk(key, text)
+    _remember(key, text)
+    return text
@@ -0,0 +1,85 @@
+"""
+Process pool for attachment text extraction.
+
+pdfplumber, PyPDF2 and python-docx are pure Python and hold the GIL, so
+parsing on the event loop stalls every other request and a thread pool
+still runs one parse at a time. Extractors run in worker processes instead;
+the cache lookup and the wait happen on a thread so the loop stays free.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional
+
+from ._extract_cache import cached_extract
+from ..core.gateway import FilePayload
+
+logger = logging.getLogger(__name__)
+
+# Worker(content, filename) -> text; must be importable by qualified name
+Extractor = Callable[[bytes, str], Optional[str]]
+
+EXTRACT_WORKERS = os.cpu_count() or 1
+
+_pool: ProcessPoolExecutor | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            # spawn, not fork: the server process runs threads (event loop
+            # executor, hashing pools) that must not be duplicated mid-lock
+            _pool = ProcessPoolExecutor(
+                max_workers=EXTRACT_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _pool
+
+
+def run_extractor(worker: Extractor, content: bytes | memoryview, filename: str) -> Optional[str]:
+    """
+    Run worker in the process pool and wait for its result.
+    Blocks, so call it from a worker thread, never from the event loop.
+    Memory-mapped payloads are not picklable and are copied to bytes.
+    Returns None if the worker process dies: the document is treated as
+    unextractable, and it is never re-parsed inside the server process.
+    """
+    global _pool
+    pool = _get_pool()
+    try:
+        return pool.submit(worker, bytes(content), filename).result()
+    except BrokenProcessPool:
+        logger.warning(f"Extraction worker died while parsing {filename}; skipping its text")
+        with _pool_lock:
+            if _pool is pool:  # Another thread may already have replaced it
+                _pool = None
+        pool.shutdown(wait=False, cancel_futures=True)
+        return None
+
+
+async def extract_text(kind: str, f: FilePayload, worker: Extractor) -> Optional[str]:
+    """Cached extraction of f without blocking the event loop."""
+    return await asyncio.to_thread(
+        cached_extract,
+        kind, f.content, f.filename,
+        lambda: run_extractor(worker, f.content, f.filename),
+        f.sha256,
+    )
+
+
+def shutdown() -> None:
+    """Stop the worker processes; called from the application lifespan."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
@@ -0,0 +1,40 @@
+"""
+Shared outbound HTTP client for provider integrations.
+
+Providers are instantiated per run, so a client owned by an instance would
+be thrown away with its connection pool. One module-level client keeps
+keep-alive connections (and their TLS sessions) warm across runs; httpx
+pools per origin, so a single client serves every provider host.
+"""
+
+from __future__ import annotations
+
+import httpx
+
+_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it on first use."""
+    global _client
+    if _client is None or _client.is_closed:
+        # HTTP/2 multiplexes concurrent runs against the same API host over
+        # one connection; plain-http origins (local Ollama) stay on HTTP/1.1
+        _client = httpx.AsyncClient(
+            timeout=httpx.Timeout(600.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=32,
+                max_connections=64,
+                keepalive_expiry=60,
+            ),
+            http2=True,
+        )
+    return _client
+
+
+async def aclose() -> None:
+    """Close the shared client; called from the application lifespan."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -0,0 +1,24 @@
+"""
+Memoized imports for optional, heavy provider dependencies.
+
+Parser and SDK modules are imported on first use, not at startup. A
+successful import is cached by sys.modules anyway, but a failed one is not:
+without memoization a missing optional backend would be searched for on
+sys.path again for every document.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+from types import ModuleType
+from typing import Optional
+
+
+@functools.cache
+def optional_import(name: str) -> Optional[ModuleType]:
+    """The named module, or None if it is not installed; resolved once per process."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
@@ -0,0 +1,67 @@
+"""
+Shared PDF text extraction for providers without native PDF input.
+
+Interpreters only need the text, so lean parsers come first: PyMuPDF, then
+pypdf. pdfplumber builds a character-level layout model per page and is
+many times slower; it is kept as the fallback for documents the others
+cannot read. Parser imports are deferred so the server process only pays
+for them where extraction actually runs (the extraction pool).
+"""
+
+from __future__ import annotations
+
+import io
+from types import ModuleType
+from typing import Callable, Optional
+
+from ._lazy import optional_import
+
+
+def _pages_pymupdf(fitz: ModuleType, content: bytes) -> list[str]:
+    with fitz.open(stream=content, filetype="pdf") as doc:
+        return [page.get_text("text") for page in doc]
+
+
+def _pages_pypdf(pypdf: ModuleType, content: bytes) -> list[str]:
+    # pypdf and its predecessor PyPDF2 share the PdfReader API
+    return [page.extract_text() or "" for page in pypdf.PdfReader(io.BytesIO(content)).pages]
+
+
+def _pages_pdfplumber(pdfplumber: ModuleType, content: bytes) -> list[str]:
+    with pdfplumber.open(io.BytesIO(content)) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages]
+
+
+_BACKENDS: tuple[tuple[str, Callable[[ModuleType, bytes], list[str]]], ...] = (
+    ("fitz", _pages_pymupdf),
+    ("pypdf", _pages_pypdf),
+    ("PyPDF2", _pages_pypdf),
+    ("pdfplumber", _pages_pdfplumber),
+)
+
+
+def extract_pdf_text(content: bytes | memoryview, filename: str) -> Optional[str]:
+    """
+    Extract page-numbered text from PDF bytes, framed with the filename.
+    Returns None when no backend is installed or no page yields text
+    (e.g. scanned PDFs). Top-level so the extraction pool can pickle it.
+    """
+    content = bytes(content)
+    for module_name, backend in _BACKENDS:
+        module = optional_import(module_name)
+        if module is None:
+            continue
+        try:
+            pages = backend(module, content)
+        except Exception:  # unreadable for this backend
+            continue
+        # Collect fragments and join once: no per-page "[Page n]" + text
+        # concatenation, and the framing is not re-copied around the body
+        parts = [f"--- File: {filename} ---\n"]
+        for i, text in enumerate(pages, 1):
+            if text and not text.isspace():
+                parts += (f"[Page {i}]\n", text, "\n\n")
+        if len(parts) > 1:
+            parts[-1] = f"\n--- End: {filename} ---"
+            return "".join(parts)
+    return None
@@ -0,0 +1,118 @@
+"""
+Shared, bounded store for provider conversation histories.
+
+Histories hold whole corpus payloads and are dropped on close_session,
+which the orchestrator calls when a run ends however it ends. One store
+serves every provider instance; as a safety net for sessions that are never
+closed, histories idle longer than TTL_SECONDS are evicted. Eviction is by
+idle time only: a count or size cap would evict the history of another run
+still in progress, failing it mid-way.
+
+All methods are synchronous and are called from the event loop only, so
+each operation is atomic without a lock.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _approx_size(msg: dict) -> int:
+    """Characters of text and base64 data carried by one message."""
+    content = msg.get("content")
+    if isinstance(content, str):
+        size = len(content)
+    else:
+        size = 0
+        for block in content or ():
+            data = (
+                block.get("text")
+                or block.get("source", {}).get("data")
+                or block.get("image_url", {}).get("url")
+                or ""
+            )
+            size += len(data)
+    return size + sum(len(image) for image in msg.get("images", ()))
+
+
+class _Session:
+    __slots__ = ("messages", "size", "last_used")
+
+    def __init__(self) -> None:
+        self.messages: list[dict] = []
+        self.size = 0
+        self.last_used = time.monotonic()
+
+
+class SessionStore:
+    """Store of message histories, expired after TTL_SECONDS idle."""
+
+    # Far longer than any gap between turns of a live run (one model call)
+    TTL_SECONDS = 3600.0
+
+    _instance: Optional[SessionStore] = None
+
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[str, _Session] = OrderedDict()
+        self.evictions = 0
+
+    @classmethod
+    def instance(cls) -> SessionStore:
+        """The process-wide store shared by all providers."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def create(self) -> str:
+        session_id = str(uuid.uuid4())
+        self._sessions[session_id] = _Session()
+        self._evict()
+        return session_id
+
+    def get(self, session_id: str) -> list[dict]:
+        """Session history, marked most recently used. Do not append to it directly."""
+        return self._touch(session_id).messages
+
+    def append(self, session_id: str, msg: dict) -> None:
+        session = self._touch(session_id)
+        session.messages.append(msg)
+        session.size += _approx_size(msg)
+        self._evict(keep=session_id)
+
+    def pop(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+
+    def _touch(self, session_id: str) -> _Session:
+        try:
+            self._sessions.move_to_end(session_id)
+        except KeyError:
+            raise ValueError(f"Session {session_id} not found") from None
+        session = self._sessions[session_id]
+        session.last_used = time.monotonic()
+        return session
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        """Drop sessions idle past the TTL, oldest first (the dict is in LRU order)."""
+        expiry = time.monotonic() - self.TTL_SECONDS
+        while self._sessions:
+            session_id, session = next(iter(self._sessions.items()))
+            if session_id == keep or session.last_used >= expiry:
+                break
+            self.pop(session_id)
+            self.evictions += 1
+            logger.warning(
+                f"Evicted session {session_id} "
+                f"({session.size:,} chars; {self.evictions} evictions total)"
+            )
@@ -4,11 +4,18 @@ Anthropic (Claude) provider for ECR-VP Interpreter Gateway.
 
 from __future__ import annotations
 
-import base64
+import asyncio
+import io
+import logging
 import os
 from datetime import datetime, timezone
 from typing import Optional
 
+from ._b64 import cached_b64
+from ._extract_cache import cached_extract
+from ._extract_pool import run_extractor
+from ._lazy import optional_import
+from ._session_store import SessionStore
 from ..core.gateway import (
     FilePayload,
     InterpreterProvider,
@@ -17,6 +24,12 @@ from ..core.gateway import (
 )
 from ..models.schema import InterpreterConfig, InterpreterResponse
 
+logger = logging.getLogger(__name__)
+
+
+# Synthetic turn placed between consecutive user messages; shared, never mutated
+_ACK_MSG = {"role": "assistant", "content": "Acknowledged. Awaiting next corpus segment."}
+
 
 class AnthropicProvider(InterpreterProvider):
 
@@ -29,7 +42,7 @@ class AnthropicProvider(InterpreterProvider):
     def __init__(self, config: InterpreterConfig):
         super().__init__(config)
         self._client = None
-        self._sessions: dict[str, list[dict]] = {}
+        self._store = SessionStore.instance()
 
     def _get_client(self):
         if self._client is None:
@@ -41,34 +54,26 @@ class AnthropicProvider(InterpreterProvider):
         return self._client
 
     async def create_session(self) -> str:
-        import uuid
-        sid = str(uuid.uuid4())
-        self._sessions[sid] = []
-        return sid
+        return self._store.create()
 
     async def send_message(self, session_id: str, message: MessagePayload) -> None:
-        if session_id not in self._sessions:
-            raise ValueError(f"Session {session_id} not found")
-        content = self._build_content(message)
-        self._sessions[session_id].append({"role": "user", "content": content})
+        self._store.get(session_id)  # Fail fast before building content
+        # PDF parsing and base64 encoding are CPU-bound; keep the event loop free
+        content = await asyncio.to_thread(self._build_content, message)
+        self._append_user(session_id, content)
 
     async def send_and_receive(self, session_id: str, message: MessagePayload) -> InterpreterResponse:
-        if session_id not in self._sessions:
-            raise ValueError(f"Session {session_id} not found")
+        self._store.get(session_id)
         client = self._get_client()
-        content = self._build_content(message)
-        self._sessions[session_id].append({"role": "user", "content": content})
-        messages = self._prepare_messages(session_id)
+        content = await asyncio.to_thread(self._build_content, message)
+        self._append_user(session_id, content)
         response = await client.messages.create(
             model=self.config.model,
             max_tokens=self.config.max_tokens,
             temperature=self.config.temperature,
-            messages=messages,
+            messages=self._store.get(session_id),
         )
-        raw_text = ""
-        for block in response.content:
-            if hasattr(block, "text"):
-                raw_text += block.text
+        raw_text = "".join(block.text for block in response.content if block.type == "text")
         return InterpreterResponse(
             raw_text=raw_text,
             token_count_input=response.usage.input_tokens,
@@ -78,7 +83,7 @@ class AnthropicProvider(InterpreterProvider):
         )
 
     async def close_session(self, session_id: str) -> None:
-        self._sessions.pop(session_id, None)
+        self._store.pop(session_id)
 
     def supports_file_upload(self) -> bool:
         return True
@@ -91,13 +96,13 @@ class AnthropicProvider(InterpreterProvider):
         if message.files:
             for f in message.files:
                 if f.mime_type == "application/pdf":
-                    txt = self._extract_pdf_text(f.content, f.filename)
+                    txt = self._cached_pdf_text(f)
                     content.append({"type": "text", "text": f"--- Document: {f.filename} ---\n{txt}\n--- End: {f.filename} ---"})
                 elif f.mime_type.startswith("image/"):
-                    content.append({"type": "image", "source": {"type": "base64", "media_type": f.mime_type, "data": base64.b64encode(f.content).decode()}})
+                    content.append({"type": "image", "source": {"type": "base64", "media_type": f.mime_type, "data": cached_b64(f)}})
                 else:
                     try:
-                        txt = f.content.decode("utf-8")
+                        txt = str(f.content, "utf-8")
                         content.append({"type": "text", "text": f"--- File: {f.filename} ---\n{txt}\n--- End: {f.filename} ---"})
                     except UnicodeDecodeError:
                         content.append({"type": "text", "text": f"[Binary file: {f.filename}, {len(f.content)} bytes]"})
@@ -105,31 +110,47 @@ class AnthropicProvider(InterpreterProvider):
             content.append({"type": "text", "text": message.text})
         return content
 
+    @classmethod
+    def _cached_pdf_text(cls, f: FilePayload) -> str:
+        text = cached_extract(
+            "anthropic-pdf", f.content, f.filename,
+            lambda: run_extractor(cls._extract_pdf_text, f.content, f.filename),
+            digest=f.sha256,
+        )
+        return text if text is not None else f"[PDF extraction failed for {f.filename}]"
+
     @staticmethod
-    def _extract_pdf_text(pdf_bytes: bytes, filename: str) -> str:
+    def _extract_pdf_text(pdf_bytes: bytes | memoryview, filename: str) -> Optional[str]:
+        # Runs in the extraction pool; _build_content is already off the loop
+        fitz = optional_import("fitz")
+        if fitz is None:
+            return None
         try:
-            import importlib
-            fitz = importlib.import_module("fitz")
-            doc = fitz.open(stream=pdf_bytes, filetype="pdf")
-            pages = [page.get_text() for page in doc]
+            doc = fitz.open(stream=bytes(pdf_bytes), filetype="pdf")
+            # Append page by page so only one page string is alive at a time
+            buf = io.StringIO()
+            for i, page in enumerate(doc):
+                if i:
+                    buf.write("\n\n")
+                buf.write(page.get_text())
             doc.close()
-            text = "\n\n".join(pages)
-            if text.strip():
+            text = buf.getvalue()
+            if text and not text.isspace():  # No stripped copy of the document
                 return text
         except Exception:
             pass
-        return f"[PDF extraction failed for {filename}]"
-
-    def _prepare_messages(self, session_id: str) -> list[dict]:
-        raw = self._sessions[session_id]
-        if not raw:
-            return []
-        messages = []
-        for i, msg in enumerate(raw):
-            messages.append(msg)
-            if i < len(raw) - 1 and msg["role"] == "user" and raw[i + 1]["role"] == "user":
-                messages.append({"role": "assistant", "content": "Acknowledged. Awaiting next corpus segment."})
-        return messages
+        return None
+
+    def _append_user(self, session_id: str, content: list[dict]) -> None:
+        """
+        Append a user turn, keeping the history API-ready: the API requires
+        alternating roles, so consecutive user turns get an acknowledgement
+        between them at append time instead of a full rebuild per request.
+        """
+        history = self._store.get(session_id)
+        if history and history[-1]["role"] == "user":
+            self._store.append(session_id, _ACK_MSG)
+        self._store.append(session_id, {"role": "user", "content": content})
 
 
 ProviderRegistry.register("anthropic", AnthropicProvider)
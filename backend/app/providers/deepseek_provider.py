@@ -5,19 +5,18 @@ Uses OpenAI-compatible API.
 
 from __future__ import annotations
 
-import json
+import os
 from typing import Optional
 
-from ..core.gateway import (
-    FilePayload,
-    InterpreterProvider,
-    MessagePayload,
-    ProviderRegistry,
-)
+import orjson
+
+from ._base import OpenAICompatibleProvider
+from ._http import get_http_client
+from ..core.gateway import MessagePayload, ProviderRegistry
 from ..models.schema import InterpreterConfig, InterpreterResponse
 
 
-class DeepSeekProvider(InterpreterProvider):
+class DeepSeekProvider(OpenAICompatibleProvider):
     """
     Provider for DeepSeek models via OpenAI-compatible API.
     """
@@ -28,32 +27,27 @@ class DeepSeekProvider(InterpreterProvider):
         if not config.api_key_env:
             config.api_key_env = "DEEPSEEK_API_KEY"
         super().__init__(config)
-        self._sessions: dict[str, list[dict]] = {}
-
-    async def create_session(self) -> str:
-        import uuid
-        session_id = str(uuid.uuid4())
-        self._sessions[session_id] = []
-        return session_id
+        # Resolved once, and before any corpus is sent: a missing key
+        # should fail the run immediately, not after the upload
+        api_key = os.environ.get(config.api_key_env, "")
+        if not api_key:
+            raise ValueError(f"API key not found: {config.api_key_env}")
+        # httpx copies headers per request, so sharing the dict is safe
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "Content-Type": "application/json",
+        }
 
     async def send_message(self, session_id: str, message: MessagePayload) -> None:
-        if session_id not in self._sessions:
+        if session_id not in self._store:
             raise ValueError(f"Session {session_id} not found")
 
-        content_parts = []
-
-        if message.files:
-            for f in message.files:
-                # DeepSeek doesn't support file uploads natively
-                # Extract text from files
-                text = self._extract_file_text(f)
-                if text:
-                    content_parts.append(text)
-
+        # DeepSeek doesn't support file uploads natively; extract text from files
+        content_parts = await self._document_texts(message.files or ())
         content_parts.append(message.text)
         full_content = "\n\n".join(content_parts)
 
-        self._sessions[session_id].append({
+        self._store.append(session_id, {
             "role": "user",
             "content": full_content,
         })
@@ -61,36 +55,26 @@ class DeepSeekProvider(InterpreterProvider):
     async def send_and_receive(
         self, session_id: str, message: MessagePayload
     ) -> InterpreterResponse:
-        import httpx
-        import os
-
-        if session_id not in self._sessions:
+        if session_id not in self._store:
             raise ValueError(f"Session {session_id} not found")
 
         await self.send_message(session_id, message)
         messages = self._prepare_messages(session_id)
 
-        api_key = os.environ.get(self.config.api_key_env, "")
-        if not api_key:
-            raise ValueError(f"API key not found: {self.config.api_key_env}")
-
-        async with httpx.AsyncClient(timeout=600.0) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/chat/completions",
-                headers={
-                    "Authorization": f"Bearer {api_key}",
-                    "Content-Type": "application/json",
-                },
-                json={
-                    "model": self.config.model,
-                    "messages": messages,
-                    "temperature": self.config.temperature,
-                    "max_tokens": self.config.max_tokens,
-                    "stream": False,
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client().post(
+            f"{self.BASE_URL}/chat/completions",
+            headers=self._headers,
+            # orjson: far faster than httpx's stdlib json on multi-MB corpus prompts
+            content=orjson.dumps({
+                "model": self.config.model,
+                "messages": messages,
+                "temperature": self.config.temperature,
+                "max_tokens": self.config.max_tokens,
+                "stream": False,
+            }),
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         choice = data["choices"][0]
         raw_text = choice["message"]["content"]
@@ -104,9 +88,6 @@ class DeepSeekProvider(InterpreterProvider):
             provider="deepseek",
         )
 
-    async def close_session(self, session_id: str) -> None:
-        self._sessions.pop(session_id, None)
-
     def supports_file_upload(self) -> bool:
         return False
 
@@ -115,53 +96,5 @@ class DeepSeekProvider(InterpreterProvider):
             return 128_000
         return 64_000
 
-    def _prepare_messages(self, session_id: str) -> list[dict]:
-        raw = self._sessions[session_id]
-        messages = []
-        for i, msg in enumerate(raw):
-            messages.append(msg)
-            if (
-                i < len(raw) - 1
-                and msg["role"] == "user"
-                and raw[i + 1]["role"] == "user"
-            ):
-                messages.append({
-                    "role": "assistant",
-                    "content": "Acknowledged. Awaiting next corpus segment.",
-                })
-        return messages
-
-    @staticmethod
-    def _extract_file_text(f: FilePayload) -> str | None:
-        """Extract text from file payload."""
-        if f.filename.lower().endswith(".pdf"):
-            try:
-                import pdfplumber
-                import io
-                with pdfplumber.open(io.BytesIO(f.content)) as pdf:
-                    pages = []
-                    for i, page in enumerate(pdf.pages):
-                        text = page.extract_text()
-                        if text:
-                            pages.append(f"[Page {i+1}]\n{text}")
-                    if pages:
-                        return f"--- File: {f.filename} ---\n" + "\n\n".join(pages) + f"\n--- End: {f.filename} ---"
-            except Exception:
-                pass
-        if f.filename.lower().endswith(".docx"):
-            try:
-                from docx import Document
-                import io
-                doc = Document(io.BytesIO(f.content))
-                paragraphs = [p.text for p in doc.paragraphs if p.text.strip()]
-                if paragraphs:
-                    return f"--- File: {f.filename} ---\n" + "\n".join(paragraphs) + f"\n--- End: {f.filename} ---"
-            except Exception:
-                pass
-        try:
-            return f"--- File: {f.filename} ---\n{f.content.decode('utf-8')}\n--- End: {f.filename} ---"
-        except UnicodeDecodeError:
-            return f"[Binary file: {f.filename}, could not extract text]"
-
 
 ProviderRegistry.register("deepseek", DeepSeekProvider)
@@ -5,20 +5,16 @@ Also serves as base for OpenAI-compatible APIs (DeepSeek, Mistral, etc.)
 
 from __future__ import annotations
 
-import base64
 import os
 from typing import Optional
 
-from ..core.gateway import (
-    FilePayload,
-    InterpreterProvider,
-    MessagePayload,
-    ProviderRegistry,
-)
+from ._b64 import cached_b64
+from ._base import OpenAICompatibleProvider
+from ..core.gateway import MessagePayload, ProviderRegistry
 from ..models.schema import InterpreterConfig, InterpreterResponse
 
 
-class OpenAIProvider(InterpreterProvider):
+class OpenAIProvider(OpenAICompatibleProvider):
     """
     Provider for OpenAI models (GPT-4o, o1, o3, etc.)
     Also usable for any OpenAI-compatible API via base_url.
@@ -35,7 +31,6 @@ class OpenAIProvider(InterpreterProvider):
     def __init__(self, config: InterpreterConfig):
         super().__init__(config)
         self._client = None
-        self._sessions: dict[str, list[dict]] = {}
 
     def _get_client(self):
         if self._client is None:
@@ -59,27 +54,21 @@ class OpenAIProvider(InterpreterProvider):
             self._client = AsyncOpenAI(**kwargs)
         return self._client
 
-    async def create_session(self) -> str:
-        import uuid
-        session_id = str(uuid.uuid4())
-        self._sessions[session_id] = []
-        return session_id
-
     async def send_message(self, session_id: str, message: MessagePayload) -> None:
-        if session_id not in self._sessions:
+        if session_id not in self._store:
             raise ValueError(f"Session {session_id} not found")
         content = self._build_content(message)
-        self._sessions[session_id].append({"role": "user", "content": content})
+        self._store.append(session_id, {"role": "user", "content": content})
 
     async def send_and_receive(
         self, session_id: str, message: MessagePayload
     ) -> InterpreterResponse:
-        if session_id not in self._sessions:
+        if session_id not in self._store:
             raise ValueError(f"Session {session_id} not found")
         
         client = self._get_client()
         content = self._build_content(message)
-        self._sessions[session_id].append({"role": "user", "content": content})
+        self._store.append(session_id, {"role": "user", "content": content})
         
         messages = self._prepare_messages(session_id)
         
@@ -101,9 +90,6 @@ class OpenAIProvider(InterpreterProvider):
             provider=self.config.provider,
         )
 
-    async def close_session(self, session_id: str) -> None:
-        self._sessions.pop(session_id, None)
-
     def supports_file_upload(self) -> bool:
         return True  # GPT-4o supports images; PDFs need text extraction
 
@@ -115,19 +101,20 @@ class OpenAIProvider(InterpreterProvider):
         if not message.files:
             return message.text
         
+        # Not pooled: content lists are kept in the session history
         content = []
         for f in message.files:
             if f.mime_type.startswith("image/"):
                 content.append({
                     "type": "image_url",
                     "image_url": {
-                        "url": f"data:{f.mime_type};base64,{base64.b64encode(f.content).decode()}"
+                        "url": cached_b64(f, f"data:{f.mime_type};base64,")
                     },
                 })
             else:
                 # OpenAI doesn't natively support PDF — extract text
                 try:
-                    text_content = f.content.decode("utf-8")
+                    text_content = str(f.content, "utf-8")
                 except UnicodeDecodeError:
                     text_content = f"[Binary file: {f.filename}, {len(f.content)} bytes]"
                 content.append({
@@ -138,22 +125,6 @@ class OpenAIProvider(InterpreterProvider):
         content.append({"type": "text", "text": message.text})
         return content
 
-    def _prepare_messages(self, session_id: str) -> list[dict]:
-        raw = self._sessions[session_id]
-        messages = []
-        for i, msg in enumerate(raw):
-            messages.append(msg)
-            if (
-                i < len(raw) - 1
-                and msg["role"] == "user"
-                and raw[i + 1]["role"] == "user"
-            ):
-                messages.append({
-                    "role": "assistant",
-                    "content": "Acknowledged. Awaiting next corpus segment.",
-                })
-        return messages
-
 
 # Register OpenAI
 ProviderRegistry.register("openai", OpenAIProvider)
@@ -10,9 +10,12 @@ Note: Sonar models include web search grounding by default.
 """
 
 import os
-import httpx
 from typing import Any, Dict, List, Optional
 
+import orjson
+
+from ._http import get_http_client
+
 
 class PerplexityProvider:
     """Perplexity Sonar API provider (OpenAI-compatible)."""
@@ -22,6 +25,11 @@ class PerplexityProvider:
 
     def __init__(self):
         self.api_key = os.getenv("PERPLEXITY_API_KEY", "")
+        # Built once; httpx copies headers per request, so sharing is safe
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
 
     def is_available(self) -> bool:
         return bool(self.api_key)
@@ -35,11 +43,6 @@ class PerplexityProvider:
         **kwargs,
     ) -> Dict[str, Any]:
         """Send completion request to Perplexity API."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
         payload = {
             "model": model,
             "messages": messages,
@@ -52,14 +55,14 @@ class PerplexityProvider:
         if kwargs.get("disable_search", True):
             payload["web_search_options"] = {"search_context_size": "none"}
 
-        async with httpx.AsyncClient(timeout=300) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/chat/completions",
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client().post(
+            f"{self.BASE_URL}/chat/completions",
+            headers=self._headers,
+            content=orjson.dumps(payload),
+            timeout=300,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
         raw_text = ""
         if data.get("choices"):
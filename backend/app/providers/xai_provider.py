@@ -9,9 +9,12 @@ Models: grok-4, grok-4-fast, grok-3, grok-3-mini
 """
 
 import os
-import httpx
 from typing import Any, Dict, List, Optional
 
+import orjson
+
+from ._http import get_http_client
+
 
 class XAIProvider:
     """xAI / Grok API provider (OpenAI-compatible)."""
@@ -21,6 +24,11 @@ class XAIProvider:
 
     def __init__(self):
         self.api_key = os.getenv("XAI_API_KEY", "")
+        # Built once; httpx copies headers per request, so sharing is safe
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
 
     def is_available(self) -> bool:
         return bool(self.api_key)
@@ -34,11 +42,6 @@ class XAIProvider:
         **kwargs,
     ) -> Dict[str, Any]:
         """Send completion request to Grok API."""
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json",
-        }
-
         payload = {
             "model": model,
             "messages": messages,
@@ -46,16 +49,15 @@ class XAIProvider:
             "temperature": temperature,
         }
 
-        async with httpx.AsyncClient(timeout=300) as client:
-            response = await client.post(
-                f"{self.BASE_URL}/chat/completions",
-                headers=headers,
-                json=payload,
-            )
-            response.raise_for_status()
-            data = response.json()
+        response = await get_http_client().post(
+            f"{self.BASE_URL}/chat/completions",
+            headers=self._headers,
+            content=orjson.dumps(payload),
+            timeout=300,
+        )
+        response.raise_for_status()
+        data = orjson.loads(response.content)
 
-        # Extract response text
         raw_text = ""
         if data.get("choices"):
             raw_text = data["choices"][0].get("message", {}).get("content", "")
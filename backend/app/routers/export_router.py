@@ -11,10 +11,10 @@ Add to main.py:
 
 import os
 import tempfile
-from pathlib import Path
 
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 
 # Adjust imports to match your project structure:
 # from app.services.export_service import create_export_bundle
@@ -73,19 +73,27 @@ async def export_session(session_id: str):
         passport_id = session.get("passport_id", "")
         corpus_dir = session.get("corpus_dir", "")
         
-        if corpus_dir and os.path.isdir(corpus_dir):
+        corpus_files = []
+        if corpus_dir:
+            # One scandir pass: DirEntry carries the file type, so no
+            # per-file stat or Path allocation
+            try:
+                with os.scandir(corpus_dir) as entries:
+                    corpus_files = [
+                        entry.path
+                        for entry in entries
+                        if entry.name.lower().endswith(".pdf") and entry.is_file()
+                    ]
+            except (FileNotFoundError, NotADirectoryError):
+                corpus_dir = ""
+        if not corpus_dir:
+            # Fallback: try to get from session segments. Existence is not
+            # checked here; create_export_bundle skips missing files.
             corpus_files = [
-                str(Path(corpus_dir) / f)
-                for f in os.listdir(corpus_dir)
-                if f.lower().endswith(".pdf")
+                fpath
+                for seg in session.get("segments", [])
+                if (fpath := seg.get("file_path", ""))
             ]
-        else:
-            # Fallback: try to get from session segments
-            corpus_files = []
-            for seg in session.get("segments", []):
-                fpath = seg.get("file_path", "")
-                if fpath and os.path.exists(fpath):
-                    corpus_files.append(fpath)
         
         if not corpus_files:
             raise HTTPException(
@@ -124,6 +132,9 @@ async def export_session(session_id: str):
         raise HTTPException(status_code=500, detail=f"Failed to create export: {str(e)}")
 
     # ─── 5. Return ZIP file ───
+    # FileResponse sets Content-Length from the file's stat and streams it in
+    # chunks (or hands the path to the server where it supports pathsend);
+    # the bundle is a one-off, so it is deleted once the response is sent.
     filename = os.path.basename(zip_path)
     return FileResponse(
         path=zip_path,
@@ -132,4 +143,5 @@ async def export_session(session_id: str):
         headers={
             "Content-Disposition": f'attachment; filename="{filename}"',
         },
+        background=BackgroundTask(os.unlink, zip_path),
     )
@@ -9,31 +9,54 @@ Add to main.py:
 """
 
 import os
-from fastapi import APIRouter
+from functools import lru_cache
+
+import orjson
+from fastapi import APIRouter, Request, Response
 from app.config.models_registry import (
-    PROVIDERS, get_models_for_api, get_provider_models, estimate_cost
+    MODELS_ETAG, PROVIDERS, get_models_for_api, get_provider_models, estimate_cost
 )
 
 router = APIRouter(tags=["models"])
 
+# Provider env keys in payload order; None for local providers (Ollama)
+_ENV_KEYS = tuple(p.get("env_key") for p in get_models_for_api()["providers"])
+
+
+def _configured_flags() -> tuple[bool, ...]:
+    """Whether each provider has an API key set, in payload order."""
+    return tuple(env_key is None or bool(os.getenv(env_key, "")) for env_key in _ENV_KEYS)
+
+
+@lru_cache(maxsize=1)
+def _models_payload_cached(flags: tuple[bool, ...]) -> tuple[bytes, str]:
+    """
+    Serialized /models body and its ETag for one set of configured flags.
+    Keyed on the flags rather than the env values, so API keys are never
+    held in the cache; a key being set or unset changes the flags and
+    rebuilds the body on the next request.
+    """
+    data = get_models_for_api()
+    # The registry payload is shared, so annotate copies rather than mutating it
+    providers = [{**p, "configured": c} for p, c in zip(data["providers"], flags)]
+    etag = f'"{MODELS_ETAG}-{"".join("1" if c else "0" for c in flags)}"'
+    return orjson.dumps({**data, "providers": providers}), etag
+
 
 @router.get("/models")
-async def list_models():
+async def list_models(request: Request):
     """
     Return all available providers and models.
     Frontend uses this to populate the New Session dialog.
-    """
-    data = get_models_for_api()
 
-    # Check which providers have API keys configured
-    for provider in data["providers"]:
-        env_key = provider.get("env_key")
-        if env_key is None:
-            provider["configured"] = True  # Local (Ollama)
-        else:
-            provider["configured"] = bool(os.getenv(env_key, ""))
+    The catalog is static, so the ETag is the registry hash plus the
+    per-provider "configured" flags; unchanged clients get a 304.
+    """
+    body, etag = _models_payload_cached(_configured_flags())
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
 
-    return data
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 
 @router.get("/models/{provider_id}")
@@ -50,7 +73,7 @@ async def list_provider_models(provider_id: str):
         "provider_id": provider_id,
         "display_name": provider.get("display_name", provider_id),
         "configured": env_key is None or bool(os.getenv(env_key, "")),
-        "models": models,
+        "models": [m.to_dict() for m in models],
     }
 
 
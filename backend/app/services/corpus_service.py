@@ -7,18 +7,48 @@ Implements Canon Lock per ECR-VP §2.5 and Engineering Spec §4.
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import json
+import os
 import shutil
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
+try:
+    import fcntl  # Serialises index updates across worker processes (POSIX only)
+except ImportError:
+    fcntl = None
+
 from ..models.schema import (
     ArchitecturalStatus,
     CorpusFile,
     CorpusPassport,
 )
+from .merkle import (
+    Proof,
+    build_merkle_tree,
+    cache_level,
+    inclusion_proof,
+    verify_against_layer,
+)
+
+# hashlib releases the GIL while digesting, so file hashing scales across threads
+HASH_WORKERS = min(32, os.cpu_count() or 1)
+# Concurrent verification reads; kept low so spinning disks are not thrashed
+VERIFY_CONCURRENCY = min(8, os.cpu_count() or 1)
+# Read size for the fused copy+hash in create_passport
+COPY_CHUNK_SIZE = 1 << 20
+# Per-corpus sidecar of (st_ino, st_size, st_mtime_ns, st_ctime_ns, sha256) by file name
+HASH_CACHE_NAME = ".hash_cache.json"
+# Tree levels persisted next to passport.json at Canon Lock
+MERKLE_TREE_NAME = "merkle_tree.json"
+# Header fields of every passport, so listings need not parse each passport.json
+INDEX_NAME = "_index.json"
 
 
 class CorpusService:
@@ -26,6 +56,7 @@ class CorpusService:
     Manages corpus files and generates Corpus Passports.
     
     Storage layout:
+        data/corpora/_index.json
         data/corpora/{passport_id}/
             passport.json
             files/
@@ -38,14 +69,106 @@ class CorpusService:
         self.data_dir = data_dir
         self.corpora_dir = data_dir / "corpora"
         self.corpora_dir.mkdir(parents=True, exist_ok=True)
+        self._hash_cache: dict[Path, dict[str, list]] = {}
+        self._hash_cache_lock = threading.Lock()
+        # passport_id -> (level, nodes) of a Merkle layer checked against the root
+        self._merkle_layers: dict[str, tuple[int, list[str]]] = {}
+        self._index_lock = threading.Lock()
+        # passport_id -> passport_to_text output, for locked (immutable) passports
+        self._text_cache: dict[str, str] = {}
 
     def compute_file_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of a file."""
-        sha256 = hashlib.sha256()
         with open(file_path, "rb") as f:
-            for chunk in iter(lambda: f.read(8192), b""):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+            return hashlib.file_digest(f, "sha256").hexdigest()
+
+    @staticmethod
+    def _copy_and_hash(src: Path, dst: Path) -> str:
+        """
+        Copy src to dst and return its SHA-256 in a single pass over the
+        bytes, instead of copying and then reading the file back to hash it.
+        Metadata is preserved as with shutil.copy2.
+        """
+        digest = hashlib.sha256()
+        buf = bytearray(COPY_CHUNK_SIZE)
+        view = memoryview(buf)
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            while n := fsrc.readinto(buf):
+                chunk = view[:n]
+                digest.update(chunk)
+                fdst.write(chunk)
+        shutil.copystat(src, dst)
+        return digest.hexdigest()
+
+    def hash_files_batch(self, paths: list[Path]) -> dict[Path, Optional[str]]:
+        """
+        SHA-256 of many files at once; None for files that do not exist.
+        Files are hashed concurrently on a thread pool, so independent
+        files use every core rather than one hash stream at a time.
+        """
+        if len(paths) <= 1:
+            return {p: self._hash_or_none(p) for p in paths}
+        with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(paths))) as pool:
+            return dict(zip(paths, pool.map(self._hash_or_none, paths)))
+
+    def hash_files_cached(self, corpus_dir: Path, paths: list[Path]) -> dict[Path, Optional[str]]:
+        """
+        Like hash_files_batch, but reuses the hash of any file whose inode,
+        size, mtime_ns and ctime_ns are unchanged since it was last hashed,
+        so a warm corpus costs one stat per file. ctime is part of the key
+        because os.utime can restore mtime after a rewrite but cannot reset
+        ctime. Persisted in a sidecar in corpus_dir
+        to survive restarts. verify_integrity deliberately does not use this.
+        """
+        with self._hash_cache_lock:
+            cache = self._hash_cache.get(corpus_dir)
+        if cache is None:
+            try:
+                cache = orjson.loads((corpus_dir / HASH_CACHE_NAME).read_bytes())
+            except (OSError, ValueError):
+                cache = {}
+
+        result: dict[Path, Optional[str]] = {}
+        misses: list[tuple[Path, list]] = []
+        for path in paths:
+            try:
+                st = path.stat()
+            except FileNotFoundError:
+                result[path] = None
+                continue
+            key = [st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns]
+            entry = cache.get(path.name)
+            # Entries from older sidecars lack ctime, never match, and are rehashed
+            if entry is not None and entry[:4] == key and len(entry) == 5:
+                result[path] = entry[4]
+            else:
+                misses.append((path, key))
+
+        hashed = self.hash_files_batch([path for path, _ in misses]) if misses else {}
+        with self._hash_cache_lock:
+            for path, key in misses:
+                result[path] = file_hash = hashed[path]
+                if file_hash is not None:
+                    cache[path.name] = [*key, file_hash]
+            self._hash_cache[corpus_dir] = cache
+            if misses:
+                self._write_hash_cache(corpus_dir, cache)
+        return result
+
+    @staticmethod
+    def _write_hash_cache(corpus_dir: Path, cache: dict[str, list]) -> None:
+        tmp = corpus_dir / f"{HASH_CACHE_NAME}.{os.getpid()}.tmp"
+        try:
+            tmp.write_bytes(orjson.dumps(cache))
+            os.replace(tmp, corpus_dir / HASH_CACHE_NAME)
+        except OSError:
+            pass  # The cache is an optimisation; hashing still works without it
+
+    def _hash_or_none(self, file_path: Path) -> Optional[str]:
+        try:
+            return self.compute_file_hash(file_path)
+        except FileNotFoundError:
+            return None
 
     def create_passport(
         self,
@@ -77,29 +200,45 @@ class CorpusService:
         files_dir = corpus_dir / "files"
         files_dir.mkdir(parents=True, exist_ok=True)
 
-        # Process each file
-        corpus_files = []
-        for order, file_path in enumerate(files, start=1):
+        # Seeds the stat-keyed hash cache, so the first run needs no re-hash
+        hash_cache: dict[str, list] = {}
+
+        def ingest(order: int, file_path: Path) -> CorpusFile:
             if not file_path.exists():
                 raise FileNotFoundError(f"File not found: {file_path}")
             
-            # Compute hash
-            file_hash = self.compute_file_hash(file_path)
-            
-            # Copy to immutable storage with canonical ordering prefix
+            # Copy to immutable storage with canonical ordering prefix,
+            # hashing the bytes as they stream through
             dest_name = f"{order:03d}_{file_path.name}"
             dest_path = files_dir / dest_name
-            shutil.copy2(file_path, dest_path)
+            file_hash = self._copy_and_hash(file_path, dest_path)
             
-            corpus_files.append(CorpusFile(
+            st = dest_path.stat()
+            hash_cache[dest_name] = [st.st_ino, st.st_size, st.st_mtime_ns, st.st_ctime_ns, file_hash]
+            return CorpusFile(
                 filename=file_path.name,
-                size_bytes=file_path.stat().st_size,
+                size_bytes=st.st_size,
                 sha256=file_hash,
                 canonical_order=order,
                 file_path=str(dest_path.relative_to(self.data_dir)),
-            ))
+            )
+
+        # Process files in parallel; map() keeps canonical order
+        with ThreadPoolExecutor(max_workers=min(HASH_WORKERS, len(files) or 1)) as pool:
+            corpus_files = list(pool.map(ingest, range(1, len(files) + 1), files))
+        with self._hash_cache_lock:
+            self._hash_cache[corpus_dir] = hash_cache
+            self._write_hash_cache(corpus_dir, hash_cache)
         
         passport.files = corpus_files
+
+        # Merkle tree over the file hashes, built once; proofs and root
+        # checks are served from it instead of re-deriving the tree
+        tree = build_merkle_tree([cf.sha256 for cf in corpus_files])
+        passport.merkle_root = tree["root"]
+        (corpus_dir / MERKLE_TREE_NAME).write_bytes(
+            orjson.dumps({"root": tree["root"], "levels": tree["levels"]})
+        )
         passport.lock()
 
         # Save passport as immutable JSON
@@ -108,6 +247,7 @@ class CorpusService:
             passport.model_dump_json(indent=2),
             encoding="utf-8",
         )
+        self._update_index({passport.passport_id: self._summary(passport)})
 
         return passport
 
@@ -117,23 +257,25 @@ class CorpusService:
         if not passport_path.exists():
             raise FileNotFoundError(f"Passport not found: {passport_id}")
         
-        data = json.loads(passport_path.read_text(encoding="utf-8"))
-        return CorpusPassport(**data)
+        # Parse and validate in one native pass, without an intermediate dict
+        return CorpusPassport.model_validate_json(passport_path.read_bytes())
 
     def get_corpus_files(self, passport: CorpusPassport) -> list[tuple[CorpusFile, Path]]:
         """
         Get corpus files in canonical order, with full paths.
         Returns list of (CorpusFile metadata, absolute file path).
         """
+        ordered = sorted(passport.files, key=lambda f: f.canonical_order)
+        paths = [self.data_dir / cf.file_path for cf in ordered]
+        hashes = self.hash_files_cached(self.corpora_dir / passport.passport_id, paths)
         result = []
-        for cf in sorted(passport.files, key=lambda f: f.canonical_order):
-            full_path = self.data_dir / cf.file_path
-            if not full_path.exists():
+        for cf, full_path in zip(ordered, paths):
+            actual_hash = hashes[full_path]
+            if actual_hash is None:
                 raise FileNotFoundError(
                     f"Corpus file missing: {cf.filename} (expected at {full_path})"
                 )
             # Verify integrity
-            actual_hash = self.compute_file_hash(full_path)
             if actual_hash != cf.sha256:
                 raise RuntimeError(
                     f"Integrity violation: {cf.filename} hash mismatch. "
@@ -148,15 +290,90 @@ class CorpusService:
         Verify SHA-256 hashes of all corpus files.
         Returns dict of filename -> integrity_ok.
         """
-        results = {}
-        for cf in passport.files:
-            full_path = self.data_dir / cf.file_path
-            if not full_path.exists():
-                results[cf.filename] = False
-                continue
-            actual_hash = self.compute_file_hash(full_path)
-            results[cf.filename] = (actual_hash == cf.sha256)
-        return results
+        paths = [self.data_dir / cf.file_path for cf in passport.files]
+        hashes = self.hash_files_batch(paths)
+        return {cf.filename: hashes[p] == cf.sha256 for cf, p in zip(passport.files, paths)}
+
+    def verify_merkle_root(self, passport: CorpusPassport) -> Optional[bool]:
+        """
+        Check the passport's recorded file hashes against the Merkle root
+        sealed at Canon Lock, catching a passport edited after lock (an
+        entry changed, added or dropped). No file is read: verify_integrity
+        ties the files to those recorded hashes, and this ties the hashes
+        to the seal. None for passports locked before roots were sealed.
+        """
+        if not passport.merkle_root:
+            return None
+        ordered = sorted(passport.files, key=lambda f: f.canonical_order)
+        return build_merkle_tree([cf.sha256 for cf in ordered])["root"] == passport.merkle_root
+
+    def _load_merkle_levels(self, passport_id: str) -> list[list[str]]:
+        tree_path = self.corpora_dir / passport_id / MERKLE_TREE_NAME
+        if not tree_path.exists():
+            raise FileNotFoundError(f"Merkle tree not found for passport: {passport_id}")
+        return orjson.loads(tree_path.read_bytes())["levels"]
+
+    def _trusted_layer(self, passport: CorpusPassport, levels: list[list[str]]) -> tuple[int, list[str]]:
+        """
+        Intermediate Merkle layer, authenticated against the sealed root once
+        per process; later spot checks stop there instead of at the root.
+        """
+        cached = self._merkle_layers.get(passport.passport_id)
+        if cached is None:
+            level = cache_level(levels)
+            layer = levels[level]
+            if build_merkle_tree(layer)["root"] != passport.merkle_root:
+                raise RuntimeError(
+                    f"Integrity violation: stored Merkle tree for {passport.passport_id} "
+                    f"does not match the sealed root"
+                )
+            cached = self._merkle_layers[passport.passport_id] = (level, layer)
+        return cached
+
+    def verify_file(self, passport: CorpusPassport, order: int) -> tuple[Optional[bool], bool, Proof]:
+        """
+        Spot-check one file against the sealed root: one file read plus
+        about log2(N)/2 node hashes up to the cached layer, instead of
+        rehashing the whole corpus. Returns (file_ok, merkle_root_ok, proof):
+        file_ok is None when the file is missing from disk, merkle_root_ok
+        is whether the stored tree still matches the sealed root (file_ok
+        is False when it does not), and proof is the file's full inclusion
+        proof up to the root.
+        """
+        if not passport.merkle_root:
+            raise ValueError(f"Passport {passport.passport_id} has no Merkle root")
+        cf = next((f for f in passport.files if f.canonical_order == order), None)
+        if cf is None:
+            raise ValueError(f"No corpus file with canonical order {order}")
+        levels = self._load_merkle_levels(passport.passport_id)
+        proof = inclusion_proof(levels, order - 1)
+        try:
+            level, layer = self._trusted_layer(passport, levels)
+        except RuntimeError:
+            merkle_ok, level, layer = False, None, None
+        else:
+            merkle_ok = True
+        leaf = self._hash_or_none(self.data_dir / cf.file_path)
+        if leaf is None:
+            return None, merkle_ok, proof
+        if not merkle_ok:
+            return False, False, proof
+        # The path up to the cached layer is a prefix of the full proof
+        return verify_against_layer(leaf, proof[:level], layer, order - 1), True, proof
+
+    async def verify_integrity_async(self, passport: CorpusPassport) -> dict[str, bool]:
+        """
+        Verify SHA-256 hashes of all corpus files concurrently off the event loop.
+        Returns dict of filename -> integrity_ok.
+        """
+        slots = asyncio.Semaphore(VERIFY_CONCURRENCY)
+
+        async def hash_one(cf: CorpusFile) -> Optional[str]:
+            async with slots:
+                return await asyncio.to_thread(self._hash_or_none, self.data_dir / cf.file_path)
+
+        hashes = await asyncio.gather(*(hash_one(cf) for cf in passport.files))
+        return {cf.filename: h == cf.sha256 for cf, h in zip(passport.files, hashes)}
 
     def list_passports(self) -> list[CorpusPassport]:
         """List all available corpus passports."""
@@ -165,17 +382,94 @@ class CorpusService:
             passport_path = corpus_dir / "passport.json"
             if passport_path.exists():
                 try:
-                    data = json.loads(passport_path.read_text(encoding="utf-8"))
-                    passports.append(CorpusPassport(**data))
+                    passports.append(CorpusPassport.model_validate_json(passport_path.read_bytes()))
                 except Exception:
                     continue  # Skip corrupted passports
         return passports
 
+    def list_passports_summary(self) -> list[dict]:
+        """
+        Header fields of all passports (see _summary), from _index.json.
+        Only passports the index does not know yet (e.g. created before it
+        existed) are parsed, and the index is repaired with them. Passports
+        that fail to load are recorded as {"unreadable": <passport.json
+        mtime_ns>} and only retried once that file changes, so a corrupt or
+        half-written directory does not force a re-parse on every call.
+        """
+        index = self._read_index()
+        with os.scandir(self.corpora_dir) as it:
+            ids = sorted(entry.name for entry in it if entry.is_dir())
+        stale = [
+            pid for pid in ids
+            if pid not in index
+            or ("unreadable" in index[pid] and index[pid]["unreadable"] != self._passport_mtime_ns(pid))
+        ]
+        if stale or len(index) != len(ids):
+            added = {}
+            for pid in stale:
+                # Stat before loading: a passport written in between leaves a
+                # mismatched mtime, so it is picked up on the next call
+                mtime_ns = self._passport_mtime_ns(pid)
+                try:
+                    added[pid] = self._summary(self.load_passport(pid))
+                except Exception:
+                    added[pid] = {"unreadable": mtime_ns}  # Not yet written, or corrupted
+            index = self._update_index(added, keep=set(ids))
+        return [entry for pid in ids if "passport_id" in (entry := index.get(pid, {}))]
+
+    def _passport_mtime_ns(self, passport_id: str) -> int:
+        try:
+            return (self.corpora_dir / passport_id / "passport.json").stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    @staticmethod
+    def _summary(passport: CorpusPassport) -> dict:
+        return {
+            "passport_id": passport.passport_id,
+            "created_at": passport.created_at.isoformat(),
+            "purpose": passport.purpose,
+            "architectural_status": passport.architectural_status.value,
+            "canon_version": passport.canon_version,
+            "files_count": len(passport.files),
+        }
+
+    def _read_index(self) -> dict[str, dict]:
+        try:
+            return orjson.loads((self.corpora_dir / INDEX_NAME).read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return {}
+
+    def _update_index(self, entries: dict[str, dict], keep: Optional[set[str]] = None) -> dict[str, dict]:
+        """
+        Merge entries into the index (dropping ids not in keep, if given)
+        and rewrite it atomically. Returns the new index.
+        """
+        with self._index_lock, open(self.corpora_dir / f"{INDEX_NAME}.lock", "a") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)  # Released when the file closes
+            index = self._read_index()
+            if keep is not None:
+                index = {pid: entry for pid, entry in index.items() if pid in keep}
+            index.update(entries)
+            tmp = self.corpora_dir / f"{INDEX_NAME}.{os.getpid()}.tmp"
+            try:
+                tmp.write_bytes(orjson.dumps(index))
+                os.replace(tmp, self.corpora_dir / INDEX_NAME)
+            except OSError:
+                pass  # Listing falls back to parsing passports
+            return index
+
     def passport_to_text(self, passport: CorpusPassport) -> str:
         """
         Generate human-readable Corpus Passport text for interpreter input.
         This is sent as the first message to each interpreter.
+        Locked passports are immutable, so their text is built once and
+        reused across interpreters and runs.
         """
+        if passport.is_locked and (text := self._text_cache.get(passport.passport_id)):
+            return text
+
         lines = [
             "═══ CORPUS PASSPORT ═══",
             f"Passport ID: {passport.passport_id}",
@@ -190,11 +484,16 @@ class CorpusService:
             lines.append(f"Constraints: {'; '.join(passport.constraints)}")
         
         lines.append(f"\nCorpus Files ({len(passport.files)} total):")
-        for cf in sorted(passport.files, key=lambda f: f.canonical_order):
-            lines.append(
-                f"  [{cf.canonical_order:03d}] {cf.filename} "
-                f"({cf.size_bytes:,} bytes, SHA-256: {cf.sha256[:16]}...)"
-            )
+        # lock() leaves files in canonical order
+        files = passport.files if passport.is_locked else sorted(passport.files, key=lambda f: f.canonical_order)
+        lines.extend(
+            f"  [{cf.canonical_order:03d}] {cf.filename} "
+            f"({cf.size_bytes:,} bytes, SHA-256: {cf.sha256[:16]}...)"
+            for cf in files
+        )
         
         lines.append("═══ END CORPUS PASSPORT ═══")
-        return "\n".join(lines)
+        text = "\n".join(lines)
+        if passport.is_locked:
+            self._text_cache[passport.passport_id] = text
+        return text
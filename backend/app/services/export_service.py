@@ -19,7 +19,7 @@ import tempfile
 import zipfile
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List
 
 from reportlab.lib.pagesizes import A4
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
@@ -31,6 +31,8 @@ from reportlab.platypus import (
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 
+from .merkle import build_merkle_tree
+
 
 # ─── Merkle Tree ─────────────────────────────────────────────────
 
@@ -43,58 +45,6 @@ def sha256_file(filepath: str) -> str:
     return h.hexdigest()
 
 
-def sha256_pair(a: str, b: str) -> str:
-    """Hash two hex strings together (Merkle node)."""
-    combined = (a + b).encode("utf-8")
-    return hashlib.sha256(combined).hexdigest()
-
-
-def build_merkle_tree(hashes: List[str]) -> Dict[str, Any]:
-    """
-    Build a Merkle tree from a list of leaf hashes.
-    Returns: {
-        "root": str,
-        "leaves": [str],
-        "levels": [[str], [str], ...],  # bottom to top
-        "leaf_count": int
-    }
-    """
-    if not hashes:
-        return {"root": "", "leaves": [], "levels": [], "leaf_count": 0}
-
-    levels = [list(hashes)]  # Level 0 = leaves
-
-    current = list(hashes)
-    while len(current) > 1:
-        next_level = []
-        for i in range(0, len(current), 2):
-            if i + 1 < len(current):
-                next_level.append(sha256_pair(current[i], current[i + 1]))
-            else:
-                # Odd element: pair with itself
-                next_level.append(sha256_pair(current[i], current[i]))
-        levels.append(next_level)
-        current = next_level
-
-    return {
-        "root": current[0],
-        "leaves": list(hashes),
-        "levels": levels,
-        "leaf_count": len(hashes),
-    }
-
-
-def verify_merkle_proof(leaf_hash: str, proof: List[Tuple[str, str]], root: str) -> bool:
-    """Verify a Merkle proof for a single leaf."""
-    current = leaf_hash
-    for sibling, direction in proof:
-        if direction == "left":
-            current = sha256_pair(sibling, current)
-        else:
-            current = sha256_pair(current, sibling)
-    return current == root
-
-
 # ─── PDF Manifest ────────────────────────────────────────────────
 
 def create_manifest_pdf(
@@ -421,7 +371,10 @@ def create_export_bundle(
         output_dir: Where to save the ZIP file
 
     Returns:
-        Path to the created ZIP file
+        Path to the created ZIP file. PDFs are stored uncompressed
+        (ZIP_STORED): they are already compressed, so DEFLATE only burns
+        CPU; everything else is deflated. The caller owns the file and
+        should delete it once sent.
     """
     now = datetime.now(timezone.utc)
     timestamp = now.strftime("%Y-%m-%d_%H%M%S")
@@ -565,6 +518,8 @@ def create_export_bundle(
                 for filename in filenames:
                     abs_path = Path(root) / filename
                     arc_name = abs_path.relative_to(bundle_dir)
-                    zf.write(abs_path, arc_name)
+                    # None falls back to the archive default (DEFLATED)
+                    compress_type = zipfile.ZIP_STORED if filename.lower().endswith(".pdf") else None
+                    zf.write(abs_path, arc_name, compress_type=compress_type)
 
         return str(zip_path)
@@ -0,0 +1,107 @@
+"""
+ECR-VP Merkle Tree
+
+Binary SHA-256 Merkle tree over hex digests, shared by Canon Lock
+(CorpusService) and the export bundle (export_service).
+Nodes hash the UTF-8 concatenation of their children's hex digests;
+an odd node at the end of a level is paired with itself.
+"""
+
+import hashlib
+from typing import Any, Dict, List, Optional, Tuple
+
+# (sibling hash, side the sibling is on: "left" or "right"), leaf to root
+Proof = List[Tuple[str, str]]
+
+
+def sha256_pair(a: str, b: str) -> str:
+    """Hash two hex strings together (Merkle node)."""
+    combined = (a + b).encode("utf-8")
+    return hashlib.sha256(combined).hexdigest()
+
+
+def build_merkle_tree(hashes: List[str]) -> Dict[str, Any]:
+    """
+    Build a Merkle tree from a list of leaf hashes.
+    Returns: {
+        "root": str,
+        "leaves": [str],
+        "levels": [[str], [str], ...],  # bottom to top
+        "leaf_count": int
+    }
+    """
+    if not hashes:
+        return {"root": "", "leaves": [], "levels": [], "leaf_count": 0}
+
+    levels = [list(hashes)]  # Level 0 = leaves
+
+    current = list(hashes)
+    while len(current) > 1:
+        next_level = []
+        for i in range(0, len(current), 2):
+            if i + 1 < len(current):
+                next_level.append(sha256_pair(current[i], current[i + 1]))
+            else:
+                # Odd element: pair with itself
+                next_level.append(sha256_pair(current[i], current[i]))
+        levels.append(next_level)
+        current = next_level
+
+    return {
+        "root": current[0],
+        "leaves": list(hashes),
+        "levels": levels,
+        "leaf_count": len(hashes),
+    }
+
+
+def cache_level(levels: List[List[str]]) -> int:
+    """
+    Level (counted up from the leaves) to keep as a trusted cache layer:
+    halfway up, so proofs against it are half length while the layer
+    itself holds only about sqrt(N) nodes.
+    """
+    return (len(levels) - 1) // 2
+
+
+def inclusion_proof(levels: List[List[str]], index: int, stop_level: Optional[int] = None) -> Proof:
+    """
+    Sibling path for leaf `index`, from a tree's stored levels (O(log N), no
+    hashing). With stop_level, the path ends at that level's node instead
+    of the root; check it with verify_against_layer.
+    """
+    if not levels or not 0 <= index < len(levels[0]):
+        raise IndexError(f"Leaf index {index} out of range")
+    if stop_level is None:
+        stop_level = len(levels) - 1
+    proof = []
+    for level in levels[:stop_level]:
+        sibling = index ^ 1
+        if sibling >= len(level):
+            sibling = index  # Odd element was paired with itself
+        proof.append((level[sibling], "left" if index & 1 else "right"))
+        index //= 2
+    return proof
+
+
+def _fold(leaf_hash: str, proof: Proof) -> str:
+    current = leaf_hash
+    for sibling, direction in proof:
+        if direction == "left":
+            current = sha256_pair(sibling, current)
+        else:
+            current = sha256_pair(current, sibling)
+    return current
+
+
+def verify_merkle_proof(leaf_hash: str, proof: Proof, root: str) -> bool:
+    """Verify a Merkle proof for a single leaf."""
+    return _fold(leaf_hash, proof) == root
+
+
+def verify_against_layer(leaf_hash: str, proof: Proof, layer: List[str], index: int) -> bool:
+    """
+    Verify a truncated proof for leaf `index` against a trusted cached
+    layer; the covering node is layer[index >> len(proof)].
+    """
+    return _fold(leaf_hash, proof) == layer[index >> len(proof)]
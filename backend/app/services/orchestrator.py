@@ -32,6 +32,8 @@ from ..models.schema import (
     InterpreterConfig,
     InterpreterResponse,
     InterpreterRun,
+    PRESCRIBED_MODE_SET,
+    PRESCRIBED_MODE_VALUES,
     ProtocolMode,
     RunState,
     SessionState,
@@ -288,9 +290,12 @@ class SessionOrchestrator:
         run: InterpreterRun,
     ) -> None:
         """Execute a single interpreter run with full protocol compliance."""
-        provider = ProviderRegistry.create(run.interpreter)
-
+        provider = provider_session_id = None
         try:
+            # Inside the try: providers may reject their config (e.g. a
+            # missing API key) at construction, which fails this run
+            provider = ProviderRegistry.create(run.interpreter)
+
             run.state = RunState.LOADING
             run.started_at = datetime.now(timezone.utc)
 
@@ -314,7 +319,10 @@ class SessionOrchestrator:
             run.corpus_loading_log.append("Reference prompt sent")
 
             # Step 4: Send corpus files in canonical order
-            corpus_files = self.corpus_service.get_corpus_files(session.passport)
+            # Re-hashes the whole corpus; keep it off the event loop
+            corpus_files = await asyncio.to_thread(
+                self.corpus_service.get_corpus_files, session.passport
+            )
 
             # Determine if we need sequential loading
             total_size = sum(cf.size_bytes for cf, _ in corpus_files)
@@ -325,8 +333,6 @@ class SessionOrchestrator:
             if needs_sequential:
                 # Sequential loading mode
                 for i, (cf, file_path) in enumerate(corpus_files, 1):
-                    file_content = file_path.read_bytes()
-
                     preamble = (
                         f"Corpus segment {i}/{len(corpus_files)}: {cf.filename}\n"
                         "Do not form final conclusions until the completion phrase is received."
@@ -336,12 +342,13 @@ class SessionOrchestrator:
                         provider_session_id,
                         MessagePayload(
                             text=preamble,
-                            files=[FilePayload(
+                            files=(FilePayload.from_path(
+                                file_path,
                                 filename=cf.filename,
-                                content=file_content,
                                 mime_type=self._guess_mime_type(cf.filename),
                                 canonical_order=cf.canonical_order,
-                            )],
+                                sha256=cf.sha256,
+                            ),),
                         ),
                     )
                     run.corpus_loading_log.append(
@@ -349,14 +356,16 @@ class SessionOrchestrator:
                     )
             else:
                 # Batch loading — send all files at once
-                files = []
-                for cf, file_path in corpus_files:
-                    files.append(FilePayload(
+                files = tuple(
+                    FilePayload.from_path(
+                        file_path,
                         filename=cf.filename,
-                        content=file_path.read_bytes(),
                         mime_type=self._guess_mime_type(cf.filename),
                         canonical_order=cf.canonical_order,
-                    ))
+                        sha256=cf.sha256,
+                    )
+                    for cf, file_path in corpus_files
+                )
 
                 await provider.send_message(
                     provider_session_id,
@@ -400,9 +409,6 @@ class SessionOrchestrator:
 
             self._save_artifact(session, run)
 
-            # Step 8: Close provider session
-            await provider.close_session(provider_session_id)
-
         except Exception as e:
             run.state = RunState.FAILED
             run.error = str(e)
@@ -410,6 +416,13 @@ class SessionOrchestrator:
             logger.error(f"Run {run.run_id} failed: {e}", exc_info=True)
 
         finally:
+            # Step 8: Close provider session, on failure and cancellation too,
+            # so its history is not left in the shared session store
+            if provider_session_id is not None:
+                try:
+                    await provider.close_session(provider_session_id)
+                except Exception as e:
+                    logger.warning(f"Run {run.run_id}: closing provider session failed: {e}")
             self._save_session(session)
 
     def _collect_source_outputs(self, source_session_id: str) -> str:
@@ -485,19 +498,16 @@ class SessionOrchestrator:
     def _find_missing_modes(self, detected: list) -> list[str]:
         """Identify which prescribed modes are missing from output."""
         detected_names = {m.mode for m in detected}
-        prescribed = {m.value for m in ProtocolMode.prescribed_order()}
-        return sorted(prescribed - detected_names)
+        return sorted(PRESCRIBED_MODE_SET - detected_names)
 
     def _check_mode_order(self, detected: list) -> bool:
         """Check if detected modes follow prescribed order."""
         if not detected:
             return False
-        prescribed = ProtocolMode.prescribed_order()
-        prescribed_values = [m.value for m in prescribed]
         detected_values = [m.mode for m in detected]
 
         # Check that the order of detected modes matches their prescribed order
-        filtered_prescribed = [m for m in prescribed_values if m in detected_values]
+        filtered_prescribed = [m for m in PRESCRIBED_MODE_VALUES if m in detected_values]
         return detected_values == filtered_prescribed
 
     # ─── Utility Methods ─────────────────────────────────────────────
@@ -585,6 +595,14 @@ class SessionOrchestrator:
             encoding="utf-8",
         )
 
+    def session_version(self, session_id: str) -> str:
+        """Cheap change token for a stored session (one stat, no parse)."""
+        try:
+            st = (self.sessions_dir / session_id / "session.json").stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Session not found: {session_id}") from None
+        return f"{st.st_mtime_ns:x}-{st.st_size:x}"
+
     def load_session(self, session_id: str) -> VerificationSession:
         """Load session from disk."""
         session_path = self.sessions_dir / session_id / "session.json"
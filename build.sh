@@ -13,12 +13,21 @@ cd "$SCRIPT_DIR/frontend"
 npm install
 npm run build
 
+echo "  Precompressing assets..."
+find dist/assets -type f \( -name "*.js" -o -name "*.css" -o -name "*.svg" -o -name "*.json" \) | while read -r f; do
+  gzip -9 -k -f "$f"
+  if command -v brotli >/dev/null 2>&1; then
+    brotli -q 11 -k -f "$f"
+  fi
+done
+
 echo "  Copying build to backend static dir..."
 rm -rf "$SCRIPT_DIR/backend/static"
 cp -r dist "$SCRIPT_DIR/backend/static"
 
 echo ""
 echo "  Build complete. Start with:"
-echo "    cd backend && uvicorn app.main:app --host 0.0.0.0 --port 8000"
+echo "    cd backend && uvicorn app.main:app --host 0.0.0.0 --port 8000 --loop uvloop --http httptools"
+echo "  (Single worker: sessions and caches are held in-process.)"
 echo ""
 echo "  Then open http://localhost:8000"
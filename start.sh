@@ -57,7 +57,7 @@ if [ -f "$SCRIPT_DIR/.env" ]; then
 fi
 
 echo "  Starting FastAPI backend on port 8000..."
-uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload &
+uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload --loop uvloop --http httptools &
 BACKEND_PID=$!
 echo "  Backend PID: $BACKEND_PID"
 echo ""